@@ -1,8 +1,24 @@
 """Doctor House Backend Module"""
 
 from __future__ import annotations
-from typing import Any, Optional
+from functools import lru_cache
+from itertools import combinations, count
+from typing import Any, Iterator, Optional
 import csv
+import hashlib
+import heapq
+import math
+import os
+import pickle
+import sys
+
+# Tie-breaker for heap entries, so that vertex items never need to be compared.
+_heap_order = count()
+
+# Where load_diagnosis_graph_cached keeps pickled copies of the loaded graph.
+GRAPH_CACHE_DIR = os.path.join(os.path.expanduser('~'), '.cache', 'doctorhouse')
+# Bump whenever Graph, _Vertex or Disease change shape, so that stale pickles are ignored.
+_GRAPH_CACHE_VERSION = 7
 
 
 class Disease:
@@ -39,28 +55,59 @@ class _Vertex:
 
     Instance Attributes:
         - item: The data stored in this vertex.
-        - neighbours: The vertices that are adjacent to this vertex.
+        - neighbours: The items adjacent to this vertex, mapped to the weight of the connecting edge.
         - kind: The type of this vertex: 'symptom' or 'disease'.
     """
     item: Any
-    neighbours: set[tuple[_Vertex, float]]
+    neighbours: dict[Any, float]
     kind: str
 
-    def __init__(self, item: Any, neighbours: set[tuple[_Vertex, float]],
-                 kind: str) -> None:
+    def __init__(self, item: Any, neighbours: dict[Any, float], kind: str) -> None:
         """Initialize a new vertex."""
         self.item = item
         self.neighbours = neighbours
         self.kind = kind
 
 
+def _unwind_path(parent: dict[Any, Any], end: Any) -> list[Any]:
+    """Return the path from the root of the given parent map to end.
+
+    The root is the item whose parent is None.
+
+    >>> _unwind_path({'A': None, 'B': 'A', 'C': 'B'}, 'C')
+    ['A', 'B', 'C']
+    """
+    path = []
+    node = end
+    while node is not None:
+        path.append(node)
+        node = parent[node]
+    path.reverse()
+    return path
+
+
 class Graph:
     """A graph.
 
     Representation Invariants:
     - all(item == self._vertices[item].item for item in self._vertices)
+
+    Private Instance Attributes:
+        - _vertices: A mapping from each item to its vertex.
+        - _diseases: The items of every 'disease' vertex.
+        - _symptoms: The items of every 'symptom' vertex.
+        - _dijkstra_trees: Memoized Dijkstra distances and parent maps, keyed by the item the
+          search started from.
+        - _pair_scores: Memoized results of get_pair_scores, keyed by the pair of symptoms.
+        - _disease_weights: For each symptom, the weight of its edge to each adjacent disease,
+          or None if it has not been built since the graph last changed.
     """
     _vertices: dict[Any, _Vertex]
+    _diseases: set[Any]
+    _symptoms: set[Any]
+    _dijkstra_trees: dict[Any, tuple[dict[Any, float], dict[Any, Any]]]
+    _pair_scores: dict[tuple[Any, Any], list[tuple[Any, float]]]
+    _disease_weights: Optional[dict[Any, dict[Any, float]]]
 
     def __init__(self) -> None:
         """Initialize an empty graph.
@@ -70,16 +117,90 @@ class Graph:
         {}
         """
         self._vertices = {}
+        self._diseases = set()
+        self._symptoms = set()
+        self._dijkstra_trees = {}
+        self._pair_scores = {}
+        self._disease_weights = None
+
+    def _clear_caches(self) -> None:
+        """Forget every memoized path and score, since the graph has changed."""
+        self._dijkstra_trees.clear()
+        self._pair_scores.clear()
+        self._disease_weights = None
+
+    def finalize(self) -> None:
+        """Build the lookup tables used by diagnosis queries.
+
+        Each vertex's adjacency is also put in sorted order, so that searches break ties
+        the same way no matter the order the edges were added in.
+
+        Call this once the graph is fully built. Adding vertices or edges afterwards
+        discards the tables, and they are rebuilt on the next query.
+
+        >>> g = Graph()
+        >>> g.add_vertex('A', 'symptom')
+        >>> g.add_vertex('B', 'disease')
+        >>> g.add_edge('A', 'B', 2)
+        >>> g.finalize()
+        >>> g._disease_weights
+        {'A': {'B': 0.5}}
+        """
+        for vertex in self._vertices.values():
+            vertex.neighbours = dict(sorted(vertex.neighbours.items(), key=lambda edge: str(edge[0])))
+        self._clear_caches()
+
+        self._disease_weights = {
+            symptom: {item: weight for item, weight in self._vertices[symptom].neighbours.items()
+                      if item in self._diseases}
+            for symptom in self._symptoms
+        }
+
+    def get_disease_weights(self, symptom: Any) -> dict[Any, float]:
+        """Return the weight of the edge between symptom and each of its adjacent diseases.
+
+        The returned dict is shared with this graph and must not be modified.
+
+        >>> g = Graph()
+        >>> g.add_vertex('A', 'symptom')
+        >>> g.add_vertex('B', 'disease')
+        >>> g.add_edge('A', 'B', 2)
+        >>> g.get_disease_weights('A')
+        {'B': 0.5}
+        """
+        if self._disease_weights is None:
+            self.finalize()
+        return self._disease_weights[symptom]
+
+    def __contains__(self, item: Any) -> bool:
+        """Return whether item is a vertex in this graph.
+
+        >>> g = Graph()
+        >>> g.add_vertex('Flu', 'disease')
+        >>> 'Flu' in g
+        True
+        >>> 'Cold' in g
+        False
+        """
+        return item in self._vertices
 
     def add_vertex(self, item: Any, item_kind: str) -> None:
         """Add a vertex with the given item to this graph.
 
+        Do nothing if the item is already in this graph.
+
         >>> g = Graph()
         >>> g.add_vertex('Flu', 'disease')
         >>> 'Flu' in g._vertices
         True
         """
-        self._vertices[item] = _Vertex(item, set(), item_kind)
+        if item not in self._vertices:
+            self._vertices[item] = _Vertex(item, {}, item_kind)
+            if item_kind == 'disease':
+                self._diseases.add(item)
+            elif item_kind == 'symptom':
+                self._symptoms.add(item)
+            self._clear_caches()
 
     def add_edge(self, item1: Any, item2: Any, edge_value: int) -> None:
         """Add an edge between two vertices.
@@ -91,14 +212,16 @@ class Graph:
         >>> g.adjacent('A', 'B')
         True
         """
-        if item1 in self._vertices and item2 in self._vertices:
-            v1 = self._vertices[item1]
-            v2 = self._vertices[item2]
-            v1.neighbours.add((v2, 1 / edge_value))
-            v2.neighbours.add((v1, 1 / edge_value))
-        else:
+        vertex1 = self._vertices.get(item1)
+        vertex2 = self._vertices.get(item2)
+        if vertex1 is None or vertex2 is None:
             raise ValueError
 
+        weight = 1 / edge_value
+        vertex1.neighbours[item2] = weight
+        vertex2.neighbours[item1] = weight
+        self._clear_caches()
+
     def adjacent(self, item1: Any, item2: Any) -> bool:
         """Return whether item1 and item2 are adjacent.
 
@@ -109,9 +232,8 @@ class Graph:
         >>> g.adjacent('A', 'B')
         True
         """
-        if item1 in self._vertices and item2 in self._vertices:
-            v1 = self._vertices[item1]
-            return any(v2[0].item == item2 for v2 in v1.neighbours)
+        if item1 in self._vertices:
+            return item2 in self._vertices[item1].neighbours
         return False
 
     def get_neighbours(self, item: Any) -> set:
@@ -125,8 +247,7 @@ class Graph:
         {'B'}
         """
         if item in self._vertices:
-            v = self._vertices[item]
-            return {neighbour[0].item for neighbour in v.neighbours}
+            return set(self._vertices[item].neighbours)
         raise ValueError
 
     def shortest_path(self, start: Any, end: Any) -> list[Any]:
@@ -139,28 +260,137 @@ class Graph:
         >>> g.shortest_path('A', 'B')
         ['A', 'B']
         """
-        queue = [[start]]
-        visited = set()
-
         if start not in self._vertices or end not in self._vertices:
             return []
 
-        while queue:
-            path = queue.pop(0)
-            node = path[-1]
+        parent = {start: None}
+        queue = [start]
 
+        # The queue is never popped: iterating over it while appending visits each
+        # vertex once, in the order it was reached.
+        for node in queue:
             if node == end:
-                return path
-
-            if node not in visited:
-                visited.add(node)
-                for neighbor in self.get_neighbours(node):
-                    new_path = list(path)
-                    new_path.append(neighbor)
-                    queue.append(new_path)
+                return _unwind_path(parent, end)
+            for neighbor in self._vertices[node].neighbours:
+                if neighbor not in parent:
+                    parent[neighbor] = node
+                    queue.append(neighbor)
 
         return []
 
+    def dijkstra(self, start: Any, end: Any) -> tuple[list[Any], float]:
+        """Return the path between start and end with the smallest total edge weight,
+        along with that total weight.
+
+        Return ([], inf) if there is no path between the two vertices.
+
+        >>> g = Graph()
+        >>> for item in ['A', 'C']:
+        ...     g.add_vertex(item, 'symptom')
+        >>> for item in ['B', 'D']:
+        ...     g.add_vertex(item, 'disease')
+        >>> g.add_edge('A', 'B', 1)
+        >>> g.add_edge('B', 'C', 1)
+        >>> g.add_edge('A', 'D', 4)
+        >>> g.add_edge('D', 'C', 4)
+        >>> g.dijkstra('A', 'C')
+        (['A', 'D', 'C'], 0.5)
+        """
+        if start not in self._vertices or end not in self._vertices:
+            return [], math.inf
+
+        distances, parent = self._dijkstra_tree(start)
+        if end not in distances:
+            return [], math.inf
+        return _unwind_path(parent, end), distances[end]
+
+    def _dijkstra_tree(self, start: Any) -> tuple[dict[Any, float], dict[Any, Any]]:
+        """Return the smallest total edge weight from start to every reachable vertex,
+        and the parent map of the paths that achieve them.
+
+        The result is computed on the first call for start and reused afterwards.
+        """
+        if start not in self._dijkstra_trees:
+            distances: dict[Any, float] = {}
+            best = {start: 0.0}
+            parent: dict[Any, Any] = {start: None}
+            heap = [(0.0, next(_heap_order), start)]
+            vertices = self._vertices
+
+            while heap:
+                distance, _, node = heapq.heappop(heap)
+                if node in distances:
+                    continue
+                distances[node] = distance
+                for neighbor, weight in vertices[node].neighbours.items():
+                    new_distance = distance + weight
+                    if neighbor not in best or new_distance < best[neighbor]:
+                        best[neighbor] = new_distance
+                        parent[neighbor] = node
+                        heapq.heappush(heap, (new_distance, next(_heap_order), neighbor))
+
+            self._dijkstra_trees[start] = (distances, parent)
+
+        return self._dijkstra_trees[start]
+
+    def get_pair_scores(self, symptom_1: Any, symptom_2: Any) -> list[tuple[Any, float]]:
+        """Return the diseases that the pair of symptoms points to, each with its score.
+
+        If the symptoms share diseases, each shared disease scores the total weight of its
+        edges to both symptoms. Otherwise, every disease on the path from symptom_1 to
+        symptom_2 with the smallest total weight scores that total weight.
+
+        The result is computed on the first call for the pair and reused afterwards. The
+        returned list is shared with this graph and must not be modified.
+
+        >>> g = Graph()
+        >>> for item in ['A', 'C']:
+        ...     g.add_vertex(item, 'symptom')
+        >>> g.add_vertex('B', 'disease')
+        >>> g.add_edge('A', 'B', 2)
+        >>> g.add_edge('C', 'B', 4)
+        >>> g.get_pair_scores('A', 'C')
+        [('B', 0.75)]
+        """
+        key = (symptom_1, symptom_2)
+        if key not in self._pair_scores:
+            weights_1 = self.get_disease_weights(symptom_1)
+            weights_2 = self.get_disease_weights(symptom_2)
+            pair_scores = [(disease, weight + weights_2[disease])
+                           for disease, weight in weights_1.items() if disease in weights_2]
+            if not pair_scores:
+                path, distance = self.dijkstra(symptom_1, symptom_2)
+                pair_scores = [(vertex, distance) for vertex in path if vertex in self._diseases]
+            self._pair_scores[key] = pair_scores
+
+        return self._pair_scores[key]
+
+    def get_diseases(self) -> set:
+        """Return the items of every disease vertex in this graph.
+
+        The returned set is shared with this graph and must not be modified.
+
+        >>> g = Graph()
+        >>> g.add_vertex('A', 'symptom')
+        >>> g.add_vertex('B', 'disease')
+        >>> g.get_diseases()
+        {'B'}
+        """
+        return self._diseases
+
+    def get_symptoms(self) -> set:
+        """Return the items of every symptom vertex in this graph.
+
+        The returned set is shared with this graph and must not be modified.
+
+        >>> g = Graph()
+        >>> g.add_vertex('A', 'symptom')
+        >>> g.add_vertex('B', 'disease')
+        >>> g.get_symptoms()
+        {'A'}
+        """
+        return self._symptoms
+
     def get_vertex_kind(self, item: Any) -> str:
         """Return the type of vertex.
 
@@ -181,10 +411,7 @@ class Graph:
         >>> g.get_weight_of_edge('A', 'B')
         0.5
         """
-        for neighbour in self._vertices[item_1].neighbours:
-            if neighbour[0].item == item_2:
-                return neighbour[1]
-        return 0.0
+        return self._vertices[item_1].neighbours.get(item_2, 0.0)
 
     def calculate_path_score(self, path: list) -> float:
         """Return the total weight of the given path.
@@ -196,10 +423,9 @@ class Graph:
         >>> g.calculate_path_score(['A', 'B'])
         0.5
         """
-        score = 0.0
-        for i in range(len(path) - 1):
-            score += self.get_weight_of_edge(path[i], path[i + 1])
-        return score
+        vertices = self._vertices
+        weights = (vertices[item].neighbours.get(next_item, 0.0) for item, next_item in zip(path, path[1:]))
+        return sum(weights, 0.0)
 
     def get_list_of_vertices(self) -> list:
         """Return a list of all vertices.
@@ -212,110 +438,191 @@ class Graph:
         return list(self._vertices.keys())
 
 
-def generate_combinations(lst: list[Any]) -> list[tuple[Any, Any]]:
-    """Return all unique pairs from lst.
+def _read_csv_rows(file_name: str, skip_duplicates: bool = False) -> Iterator[list[str]]:
+    """Yield every row of the given CSV file after its header, with each cell stripped.
 
-    >>> generate_combinations(['a', 'b', 'c'])
-    [('a', 'b'), ('a', 'c'), ('b', 'c')]
+    Cells are interned, since the same symptom and disease names repeat across every file
+    and are used as dict keys throughout the graph. If skip_duplicates is True, lines that
+    repeat an earlier line are dropped before they are parsed.
     """
-    result: list[tuple[Any, Any]] = []
-    for i in range(len(lst)):
-        for j in range(i + 1, len(lst)):
-            result.append((lst[i], lst[j]))
-    return result
+    with open(file_name, mode='r', newline='') as file:
+        reader = csv.reader(dict.fromkeys(file) if skip_duplicates else file)
+        next(reader)
+        for row in reader:
+            yield [sys.intern(element.strip()) for element in row]
 
 
 def load_diagnosis_graph(symptom_file: str, dataset_file: str,
                          description_file: str, precaution_file: str) -> tuple[Graph, list, dict]:
-    """Load the diagnosis graph and related data."""
-    with open(symptom_file, mode='r') as file:
-        reader = csv.reader(file)
-        next(reader)
-        severity_map = {element[0].strip(): element[1].strip() for element in reader}
+    """Load the diagnosis graph and related data.
+
+    Only names in symptom_file that are symptoms of some disease in dataset_file are listed
+    as symptoms, so every listed symptom is a symptom vertex of the graph.
+
+    >>> _, symptoms_list, _ = load_diagnosis_graph('Symptom-severity.csv', 'dataset.csv',
+    ...                                            'symptom_Description.csv', 'symptom_precaution.csv')
+    >>> 'itching' in symptoms_list, 'prognosis' in symptoms_list
+    (True, False)
+    """
+    severity_map = {row[0]: int(row[1]) for row in _read_csv_rows(symptom_file)}
 
     name_to_disease_map = {}
-    with open(dataset_file, mode='r') as file:
-        reader = csv.reader(file)
-        next(reader)
-        for row in reader:
-            symptoms = {element.strip() for element in row[1:] if element != ""}
-            if row[0].strip() in name_to_disease_map:
-                name_to_disease_map[row[0].strip()].symptoms.update(symptoms)
-            else:
-                name_to_disease_map[row[0].strip()] = Disease(name=row[0].strip(), symptoms=symptoms)
-
-    with open(description_file, mode='r') as file:
-        reader = csv.reader(file)
-        next(reader)
-        for row in reader:
-            name_to_disease_map[row[0].strip()].description = row[1].strip()
+    for row in _read_csv_rows(dataset_file, skip_duplicates=True):
+        disease = name_to_disease_map.get(row[0])
+        if disease is None:
+            disease = name_to_disease_map[row[0]] = Disease(name=row[0])
+        disease.symptoms.update(element for element in row[1:] if element != "")
 
-    with open(precaution_file, mode='r') as file:
-        reader = csv.reader(file)
-        next(reader)
-        for row in reader:
-            for i in range(1, len(row)):
-                name_to_disease_map[row[0].strip()].advice.append(row[i].strip())
+    for row in _read_csv_rows(description_file):
+        name_to_disease_map[row[0]].description = row[1]
+
+    for row in _read_csv_rows(precaution_file):
+        name_to_disease_map[row[0]].advice.extend(row[1:])
 
-    symptoms_list = list(severity_map)
     diagnosis_graph = Graph()
 
     for disease in name_to_disease_map:
-        if disease not in diagnosis_graph.get_list_of_vertices():
-            diagnosis_graph.add_vertex(disease, 'disease')
+        diagnosis_graph.add_vertex(disease, 'disease')
 
         for symptom in name_to_disease_map[disease].symptoms:
-            if symptom not in diagnosis_graph.get_list_of_vertices():
-                diagnosis_graph.add_vertex(symptom, 'symptom')
+            diagnosis_graph.add_vertex(symptom, 'symptom')
+            diagnosis_graph.add_edge(disease, symptom, severity_map[symptom])
+
+    symptom_vertices = diagnosis_graph.get_symptoms()
+    symptoms_list = [symptom for symptom in severity_map if symptom in symptom_vertices]
 
-            diagnosis_graph.add_edge(disease, symptom, int(severity_map[symptom]))
+    diagnosis_graph.finalize()
 
     return diagnosis_graph, symptoms_list, name_to_disease_map
 
 
+def load_diagnosis_graph_cached(symptom_file: str, dataset_file: str,
+                                description_file: str, precaution_file: str) -> tuple[Graph, list, dict]:
+    """Return the same data as load_diagnosis_graph, reusing a pickled copy from an earlier run
+    as long as none of the given files has been moved, modified or resized since.
+
+    The pickled copy is kept in GRAPH_CACHE_DIR. If it cannot be read or written, the files
+    are simply loaded again.
+    """
+    file_names = (symptom_file, dataset_file, description_file, precaution_file)
+    key = hashlib.blake2b(digest_size=16)
+    for file_name in file_names:
+        stat = os.stat(file_name)
+        key.update(f'\0{os.path.abspath(file_name)}:{stat.st_mtime_ns}:{stat.st_size}'.encode())
+    cache_file = os.path.join(GRAPH_CACHE_DIR, f'{_graph_cache_prefix()}{key.hexdigest()}.pkl')
+
+    try:
+        with open(cache_file, mode='rb') as file:
+            return pickle.load(file)
+    except Exception:
+        # A missing, truncated or incompatible copy is just a cache miss
+        pass
+
+    result = load_diagnosis_graph(*file_names)
+    _write_graph_cache(cache_file, result)
+    return result
+
+
+def _graph_cache_prefix() -> str:
+    """Return the prefix of the names of the graphs cached by this version of the module."""
+    return f'graph-v{_GRAPH_CACHE_VERSION}-'
+
+
+def _write_graph_cache(cache_file: str, result: tuple[Graph, list, dict]) -> None:
+    """Pickle result to cache_file in GRAPH_CACHE_DIR, and delete the graphs cached there by
+    older versions of this module.
+
+    The pickle is written to a temporary file that then replaces cache_file, so a crash or a
+    second instance of the app never leaves a partly written cache_file behind. Errors are
+    ignored, since the cache is only an optimization.
+    """
+    temp_file = f'{cache_file}.{os.getpid()}.tmp'
+    try:
+        os.makedirs(GRAPH_CACHE_DIR, exist_ok=True)
+        with open(temp_file, mode='wb') as file:
+            pickle.dump(result, file, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(temp_file, cache_file)
+    except OSError:
+        try:
+            os.remove(temp_file)
+        except OSError:
+            pass
+        return
+
+    # Copies from older versions will never be read again. Copies of the current version are
+    # kept, since they may belong to another checkout of the CSV files.
+    prefix = _graph_cache_prefix()
+    for name in os.listdir(GRAPH_CACHE_DIR):
+        if name.startswith('graph-') and name.endswith('.pkl') and not name.startswith(prefix):
+            try:
+                os.remove(os.path.join(GRAPH_CACHE_DIR, name))
+            except OSError:
+                pass
+
+
+@lru_cache(maxsize=1)
+def get_graph() -> tuple[Graph, list, dict]:
+    """Return the diagnosis graph and related data loaded from the project's CSV files.
+
+    The files are only read on the first call; later calls return the same objects.
+    """
+    return load_diagnosis_graph_cached('Symptom-severity.csv',
+                                       'dataset.csv',
+                                       'symptom_Description.csv',
+                                       'symptom_precaution.csv')
+
+
 def calculate_potential_disease(diagnosis_graph: Graph, symptoms: list) -> dict[str, float]:
     """Return the likelihood of each disease based on the provided symptoms.
 
+    Raise ValueError if any of the symptoms is not a symptom vertex of diagnosis_graph.
+
     >>> g = Graph()
     >>> g.add_vertex('Headache', 'symptom')
     >>> g.add_vertex('Flu', 'disease')
     >>> g.add_edge('Headache', 'Flu', 2)
     >>> calculate_potential_disease(g, ['Headache'])
     {'Flu': 100.0}
+    >>> g.add_vertex('Fever', 'symptom')
+    >>> g.add_edge('Fever', 'Flu', 4)
+    >>> calculate_potential_disease(g, ['Headache', 'Fever'])
+    {'Flu': 100.0}
+    >>> calculate_potential_disease(g, ['Headache', 'Sneezing'])
+    Traceback (most recent call last):
+    ...
+    ValueError: Unknown symptoms: Sneezing
     """
+    known_symptoms = diagnosis_graph.get_symptoms()
+    unknown = [symptom for symptom in symptoms if symptom not in known_symptoms]
+    if unknown:
+        raise ValueError(f"Unknown symptoms: {', '.join(map(str, unknown))}")
+
     scores = {}
 
     if len(symptoms) == 1:
-        neighbours = diagnosis_graph.get_neighbours(symptoms[0])
-        for neighbour in neighbours:
-            scores[neighbour] = diagnosis_graph.get_weight_of_edge(neighbour, symptoms[0])
+        scores = dict(diagnosis_graph.get_disease_weights(symptoms[0]))
     else:
-        for symptom_1, symptom_2 in generate_combinations(symptoms):
-            path = diagnosis_graph.shortest_path(symptom_1, symptom_2)
-            scores.update(calculate_score_path(path, diagnosis_graph))
+        get_pair_scores = diagnosis_graph.get_pair_scores
+        for symptom_1, symptom_2 in combinations(symptoms, 2):
+            scores.update(get_pair_scores(symptom_1, symptom_2))
 
-    scores = {disease: 1 / score for disease, score in scores.items() if score != 0}
-    sum_scores = sum(scores.values())
-    scores = {disease: (score / sum_scores) * 100 for disease, score in scores.items()}
+    inverses = {disease: 1 / score for disease, score in scores.items() if score != 0}
+    if not inverses:
+        return {}
 
-    return scores
+    factor = 100 / sum(inverses.values())
+    return {disease: inverse * factor for disease, inverse in inverses.items()}
 
 
-def calculate_score_path(path: list, diagnosis_graph: Graph) -> dict[str:float]:
-    """ Helper function for calculate_potential_disease, calculates the score of a given path"""
-    scores = {}
-    for vertex in path:
-        if diagnosis_graph.get_vertex_kind(vertex) == "disease":
-            scores[vertex] = scores.get(vertex, 0) + diagnosis_graph.calculate_path_score(path)
-    return scores
 
 
 if __name__ == '__main__':
 
     import python_ta
     python_ta.check_all(config={
-        'extra-imports': ['csv', 'matplotlib', 'tkinter', 'backend', 'matplotlib.pyplot', 'matplotlib.figure',
+        'extra-imports': ['csv', 'collections', 'functools', 'hashlib', 'heapq', 'itertools', 'math', 'os', 'pickle',
+                          'sys', 'matplotlib', 'tkinter', 'backend', 'matplotlib.pyplot', 'matplotlib.figure',
                           'matplotlib.backends.backend_tkagg'],
-        'allowed-io': ['print', 'load_diagnosis_graph'],
+        'allowed-io': ['print', '_read_csv_rows', 'load_diagnosis_graph_cached', '_write_graph_cache'],
         'max-line-length': 120
     })
@@ -1,8 +1,12 @@
 """This module provides the graphical user interface for our remote diagnosis software"""
+from __future__ import annotations
+from bisect import bisect_left, bisect_right
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import lru_cache, partial
+from typing import Optional
+import threading
 import tkinter as tk
 from tkinter import ttk
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
-from matplotlib.figure import Figure
 import backend
 
 
@@ -10,16 +14,45 @@ class DoctorHouseApp:
     """Represent the main window of app
      Instance Attributes:
         - root: represent the main window
-        - widgets: A dictionay with elements as each ui element of the root window"""
+        - widgets: A dictionay with elements as each ui element of the root window
+        - _pending_update: the id of the scheduled dropdown refresh, if one is waiting to run
+        - _last_filtered: the symptoms currently listed in the dropdown
+        - _last_typed: the lowercase entry text the dropdown was last filtered by
+        - _selected: the symptoms currently in the selected symptoms list box
+        - _dropdown_rect: the x, y and width the dropdown should be placed at, below the entry
+        - _placed_rect: the x, y and width the dropdown is placed at, or None if it is hidden
+        - _dropdown_widgets: the widgets that can be clicked without hiding the dropdown
+        - diagnosis_window: the diagnosis window, created the first time a diagnosis is checked
+        - _executor: the worker thread that diagnoses, so the window stays responsive meanwhile
+        - _is_fullscreen: whether the window is currently fullscreen"""
 
     root: tk.Tk
     widgets: dict
+    _pending_update: Optional[str]
+    _last_filtered: list[str]
+    _last_typed: Optional[str]
+    _selected: set[str]
+    _dropdown_rect: tuple[int, int, int]
+    _placed_rect: Optional[tuple[int, int, int]]
+    _dropdown_widgets: frozenset
+    diagnosis_window: Optional[DiagnosisWindow]
+    _executor: ThreadPoolExecutor
+    _is_fullscreen: bool
 
     def __init__(self, my_root: tk.Tk) -> None:
         self.root = my_root
         self.root.title("Doctor House")
         self.root.geometry("500x400")
         self.widgets = {}
+        self._pending_update = None
+        self._last_filtered = []
+        self._last_typed = None
+        self._selected = set()
+        self._dropdown_rect = (0, 0, 0)
+        self._placed_rect = None
+        self.diagnosis_window = None
+        self._executor = ThreadPoolExecutor(max_workers=1)
+        self._is_fullscreen = True
         self.root.attributes('-fullscreen', True)
         self.root.bind("<Escape>", self.toggle_fullscreen)
 
@@ -45,14 +78,18 @@ class DoctorHouseApp:
         self.widgets["right_frame"].grid(row=0, column=1, sticky="nsew")
 
         ttk.Label(self.widgets["left_frame"], text="Search Symptoms:").pack(anchor="w")
-        self.widgets["entry"] = ttk.Entry(self.widgets["left_frame"])
+        self.widgets["entry text"] = tk.StringVar(self.root)
+        self.widgets["entry text"].trace_add("write", lambda *_args: self.update_list())
+        self.widgets["entry"] = ttk.Entry(self.widgets["left_frame"], textvariable=self.widgets["entry text"])
         self.widgets["entry"].pack(fill=tk.X, pady=5)
-        self.widgets["entry"].bind("<KeyRelease>", self.update_list)
         self.widgets["entry"].bind("<FocusIn>", self.show_dropdown)
+        self.widgets["entry"].bind("<Configure>", self.measure_dropdown)
 
         self.widgets["dropdown frame"] = ttk.Frame(self.root, relief=tk.SUNKEN, borderwidth=1)
-        self.widgets["listbox"] = tk.Listbox(self.widgets["dropdown frame"], height=6, bg="#2b2b2b", fg="white",
-                                             selectbackground="#FFF2F2", selectforeground="#2b2b2b")
+        self.widgets["dropdown options"] = tk.StringVar(self.root)
+        self.widgets["listbox"] = tk.Listbox(self.widgets["dropdown frame"], height=DROPDOWN_HEIGHT, bg="#2b2b2b",
+                                             fg="white", selectbackground="#FFF2F2", selectforeground="#2b2b2b",
+                                             listvariable=self.widgets["dropdown options"])
         self.widgets["listbox"].pack(fill=tk.BOTH, expand=True)
         self.widgets["listbox"].bind("<ButtonRelease-1>", self.select_option)
 
@@ -74,70 +111,233 @@ class DoctorHouseApp:
         self.widgets["label_error"] = ttk.Label(self.widgets["right_frame"], text="")
         self.widgets["label_error"].pack(pady=5)
 
+        self._dropdown_widgets = frozenset((self.widgets["entry"], self.widgets["listbox"]))
         self.root.bind('<Button-1>', self.hide_dropdown)
 
+        # Filtering needs the symptoms GRAPH_LOADER is still reading, so keep the entry disabled
+        # until it is done rather than wait for it on the Tk thread.
+        self.widgets["entry"].state(['disabled'])
+        self.widgets["label_error"].config(text="Loading symptoms...", foreground="black")
+        self._check_data_loaded()
+
+    def _check_data_loaded(self) -> None:
+        """Enable the entry once GRAPH_LOADER has finished, checking again later if not."""
+        if GRAPH_LOADER is not None and GRAPH_LOADER.is_alive():
+            self.root.after(GRAPH_POLL_DELAY, self._check_data_loaded)
+            return
+        self.widgets["entry"].state(['!disabled'])
+        self.widgets["label_error"].config(text="")
+
     def toggle_fullscreen(self, _event: tk.Event = None) -> None:
         """Toggle fullscreen mode."""
-        is_fullscreen = self.root.attributes('-fullscreen')
-        self.root.attributes('-fullscreen', not is_fullscreen)
+        self._is_fullscreen = not self._is_fullscreen
+        self.root.attributes('-fullscreen', self._is_fullscreen)
 
     def update_list(self, _event: tk.Event = None) -> None:
+        """Schedule a dropdown refresh, so a burst of keystrokes only refreshes it once.
+
+        This runs whenever the entry text is written, and does nothing if the text is what the
+        dropdown was last filtered by."""
+        if self.widgets["entry"].get().lower() == self._last_typed:
+            return
+        if self._pending_update is not None:
+            self.root.after_cancel(self._pending_update)
+        self._pending_update = self.root.after(UPDATE_LIST_DELAY, self._do_update_list)
+
+    def _do_update_list(self) -> None:
         """Update dropdown list based on user input."""
+        self._pending_update = None
         typed = self.widgets["entry"].get().lower()
-        self.widgets["listbox"].delete(0, tk.END)
-        filtered = [symptom for symptom in SYMPTOM_OPTIONS if typed in symptom.lower()]
+        self._last_typed = typed
+        filtered = filter_symptoms(typed)
+        if filtered != self._last_filtered:
+            self.widgets["dropdown options"].set(tuple(filtered))
+            self._last_filtered = filtered
         if filtered:
-            for item in filtered:
-                self.widgets["listbox"].insert(tk.END, item)
-            x_size = self.widgets["entry"].winfo_x()
-            y_size = self.widgets["entry"].winfo_y() + self.widgets["entry"].winfo_height()
-            width = self.widgets["entry"].winfo_width()
-            self.widgets["dropdown frame"].place(x=x_size, y=y_size, width=width)
+            self._place_dropdown()
         else:
-            self.widgets["dropdown frame"].place_forget()
+            self._forget_dropdown()
 
     def show_dropdown(self, _event: tk.Event = None) -> None:
         """Show dropdown list when user types in entry"""
-        self.update_list()
+        self.measure_dropdown()
+        self._do_update_list()
+
+    def measure_dropdown(self, _event: tk.Event = None) -> None:
+        """Work out where the dropdown goes from the current geometry of the entry.
+
+        This only runs when the entry gains focus or changes geometry, not on every keystroke."""
+        x_size = self.widgets["entry"].winfo_x()
+        y_size = self.widgets["entry"].winfo_y() + self.widgets["entry"].winfo_height()
+        width = self.widgets["entry"].winfo_width()
+        self._dropdown_rect = (x_size, y_size, width)
+        if self._placed_rect is not None:
+            self._place_dropdown()
+
+    def _place_dropdown(self) -> None:
+        """Show the dropdown below the entry, unless it is already shown there."""
+        if self._placed_rect != self._dropdown_rect:
+            x_size, y_size, width = self._dropdown_rect
+            self.widgets["dropdown frame"].place(x=x_size, y=y_size, width=width)
+            self._placed_rect = self._dropdown_rect
 
-    def select_option(self, _event: tk.Event) -> None:
+    def _forget_dropdown(self) -> None:
+        """Hide the dropdown, unless it is already hidden."""
+        if self._placed_rect is not None:
+            self.widgets["dropdown frame"].place_forget()
+            self._placed_rect = None
+
+    def select_option(self, event: tk.Event) -> None:
         """Show the selected option in selected symptoms list box and close the dropdown."""
-        if not self.widgets["listbox"].curselection():
+        index = self.widgets["listbox"].nearest(event.y)
+        if not 0 <= index < len(self._last_filtered):
             return
-        selected = self.widgets["listbox"].get(self.widgets["listbox"].curselection())
+        selected = self._last_filtered[index]
+        # Drop any refresh still waiting from the last keystroke, since it would run after the
+        # entry is cleared and reopen the dropdown with every symptom.
+        if self._pending_update is not None:
+            self.root.after_cancel(self._pending_update)
+            self._pending_update = None
+        # Clearing the entry writes its text, so mark the empty text as already filtered to
+        # keep the dropdown from reopening.
+        self._last_typed = ""
         self.widgets["entry"].delete(0, tk.END)
-        self.widgets["lst_box"].insert(tk.END, selected)
-        self.widgets["dropdown frame"].place_forget()
+        if selected not in self._selected:
+            self._selected.add(selected)
+            self.widgets["lst_box"].insert(tk.END, selected)
+        self._forget_dropdown()
 
     def hide_dropdown(self, event: tk.Event) -> None:
         """Hide dropdown when clicking outside the dropdown and entry."""
-        if event.widget not in (self.widgets["entry"], self.widgets["listbox"]):
-            self.widgets["dropdown frame"].place_forget()
+        if self._placed_rect is not None and event.widget not in self._dropdown_widgets:
+            self._forget_dropdown()
 
     def clear_lst_box(self) -> None:
         """Clear the list box of selected symptoms."""
         self.widgets["lst_box"].delete(0, tk.END)
+        self._selected.clear()
 
     def check_diagnosis(self) -> None:
         """Calculate the potential diseases and show error if no symptom was selected."""
         patient_symptoms = self.widgets["lst_box"].get(0, tk.END)
         if patient_symptoms:
-            result = backend.calculate_potential_disease(DIAGNOSIS_GRAPH, patient_symptoms)
-            DiagnosisWindow(self.root, result)
-            self.clear_lst_box()
+            self.widgets["label_error"].config(text="Computing...", foreground="black")
+            self.widgets["btn_submit"].state(['disabled'])
+            future = self._executor.submit(diagnose, patient_symptoms)
+            self.root.after(DIAGNOSIS_POLL_DELAY, self._show_diagnosis, future)
         else:
             self.widgets["label_error"].config(text="Please select symptoms!!", foreground="red")
             self.root.after(1000, lambda: self.widgets["label_error"].config(text=""))
 
+    def _show_diagnosis(self, future: Future) -> None:
+        """Show the result of future in the diagnosis window once it is ready, checking again later if not."""
+        if not future.done():
+            self.root.after(DIAGNOSIS_POLL_DELAY, self._show_diagnosis, future)
+            return
+
+        self.widgets["btn_submit"].state(['!disabled'])
+        try:
+            result = future.result()
+        except Exception as e:
+            self.widgets["label_error"].config(text=f"Error during diagnosis: {e}", foreground="red")
+            return
+
+        self.widgets["label_error"].config(text="")
+        if self.diagnosis_window is None:
+            self.diagnosis_window = DiagnosisWindow(self.root, result)
+        else:
+            self.diagnosis_window.show(result)
+        self.clear_lst_box()
+
+
+def diagnose(patient_symptoms: tuple[str, ...]) -> dict[str, float]:
+    """Return the likelihood of each disease given the patient's symptoms."""
+    diagnosis_graph, _, _ = get_diagnosis_data()
+    return backend.calculate_potential_disease(diagnosis_graph, patient_symptoms)
+
+
+def filter_symptoms(typed: str) -> list[str]:
+    """Return every symptom whose lowercase name contains typed.
+
+    Symptoms starting with typed are found by binary search and listed first, followed by
+    the symptoms containing typed elsewhere in their name.
+    """
+    keys, symptoms = get_symptom_index()
+    start = bisect_left(keys, typed)
+    end = bisect_left(keys, typed + '\uffff', start)
+    filtered = list(symptoms[start:end])
+    if typed:
+        buffer, offsets = get_symptom_buffer()
+        position = buffer.find(typed)
+        while position != -1:
+            i = bisect_right(offsets, position) - 1
+            if position != offsets[i]:
+                filtered.append(symptoms[i])
+            position = buffer.find(typed, offsets[i] + len(keys[i]) + 1)
+    return filtered
+
+
+def get_diagnosis_data() -> tuple[backend.Graph, list, dict]:
+    """Return the diagnosis graph and related data, waiting for GRAPH_LOADER to finish loading them
+    if it was started."""
+    if GRAPH_LOADER is not None:
+        GRAPH_LOADER.join()
+    return backend.get_graph()
+
+
+@lru_cache(maxsize=1)
+def get_symptom_index() -> tuple[tuple[str, ...], tuple[str, ...]]:
+    """Return the lowercase symptom names in sorted order, alongside the symptom each one belongs to."""
+    _, symptoms_list, _ = get_diagnosis_data()
+    keys, symptoms = zip(*sorted((symptom.lower(), symptom) for symptom in symptoms_list))
+    return keys, symptoms
+
+
+@lru_cache(maxsize=None)
+def get_disease_info(name: str) -> str:
+    """Return the description and advice text shown for the disease with the given name."""
+    _, _, name_to_disease_map = get_diagnosis_data()
+    disease = name_to_disease_map[name]
+    return (disease.description + "\n"
+            + "-------------------------------------------------------------\n"
+            + "Advice:\n"
+            + "".join(f"• {item}\n" for item in disease.advice))
+
+
+@lru_cache(maxsize=1)
+def get_symptom_buffer() -> tuple[str, list[int]]:
+    """Return the lowercase symptom names in get_symptom_index joined into one string, each
+    followed by a separator, along with the position in that string where each name starts.
+
+    A single str.find over the joined string searches every name at once, and the separator
+    stops a match from running across two names."""
+    keys, _ = get_symptom_index()
+    offsets = []
+    position = 0
+    for key in keys:
+        offsets.append(position)
+        position += len(key) + 1
+    return '\x01'.join(keys) + '\x01', offsets
+
 
 class DiagnosisWindow:
     """Representing the window that would show up after clicking the checking button in main window
          Instance Attributes:
         - pop_up: represent the main window of this top level window
-        - elements: A dictionay with elements as each ui element of the pop_up window"""
+        - elements: A dictionay with elements as each ui element of the pop_up window
+        - chart_data: the probabilities of the diseases currently charted
+        - _pending_draw: the id of the scheduled chart redraw, if one is waiting to run
+        - _chart_size: the width and height of the canvas when its axes were last drawn
+        - _is_fullscreen: whether the window is currently fullscreen
+
+    The window is built once and reused: closing it only hides it until show is called again."""
 
     pop_up: tk.Toplevel
     elements: dict
+    chart_data: dict
+    _pending_draw: Optional[str]
+    _chart_size: tuple[int, int]
+    _is_fullscreen: bool
 
     def __init__(self, parent: tk.Tk, data: dict) -> None:
         """Create diagnosis window after the user pressed the relative button"""
@@ -145,12 +345,17 @@ class DiagnosisWindow:
         self.pop_up.title("Diagnosis")
         self.pop_up.geometry("600x500")
         self.elements = {}
+        self.chart_data = {}
+        self._pending_draw = None
+        self._chart_size = (0, 0)
+        self._is_fullscreen = True
 
         self.pop_up.attributes('-fullscreen', True)
 
         self.pop_up.bind("<Escape>", self.toggle_fullscreen)
+        self.pop_up.protocol("WM_DELETE_WINDOW", self.pop_up.withdraw)
 
-        self.create_disease_chart(data)
+        self.create_disease_chart()
 
         self.elements["frame_below"] = ttk.Frame(self.pop_up)
         self.elements["frame_below"].grid(row=1, column=0, sticky="nsew", padx=15, pady=15)
@@ -159,83 +364,123 @@ class DiagnosisWindow:
         self.elements["button_frame_pop"].pack(fill=tk.X, pady=5)
 
         ttk.Label(self.elements["frame_below"], text="Disease's description").pack(anchor="w", pady=5)
-        self.elements["lst_box_info"] = tk.Text(self.elements["frame_below"], wrap=tk.WORD, height=10, width=50,
-                                                bg="#C7D9DD",
-                                                fg="black",
-                                                padx=10, pady=10, font=("Lexend", 10))
+        self.elements["lst_box_info"] = tk.Label(self.elements["frame_below"], text="", justify=tk.LEFT, anchor="nw",
+                                                 bg="#C7D9DD",
+                                                 fg="black",
+                                                 padx=10, pady=10, font=("Lexend", 10))
         self.elements["lst_box_info"].pack(fill=tk.BOTH, expand=True)
-
-        for i, disease in enumerate(data):
-            button_info = ttk.Button(self.elements["button_frame_pop"], text=f"{disease}",
-                                     command=lambda disease=disease: self.show_info(disease))
-            button_info.grid(row=0, column=i, sticky="ew", padx=5)
-
-        style_diagnosis = ttk.Style(self.pop_up)
-        style_diagnosis.theme_use('clam')
-        style_diagnosis.configure('TFrame', background='#ADB2D4')
-        style_diagnosis.configure('TLabel', background='#ADB2D4', foreground='black', font=('Lexend', 10))
-        style_diagnosis.configure('TButton', background='#2b2b2b', foreground='white')
-        style_diagnosis.map('TButton', background=[('active', '#FFF2F2')], foreground=[('active', '#2b2b2b')])
+        self.elements["lst_box_info"].bind(
+            "<Configure>", lambda event: event.widget.config(wraplength=max(event.width - 20, 1)))
 
         self.pop_up.columnconfigure(0, weight=1)
         self.pop_up.rowconfigure(1, weight=1)
         self.pop_up.rowconfigure(0, weight=1)
         self.pop_up.config(bg="#ADB2D4")
 
+        self.show(data)
+
+    def show(self, data: dict) -> None:
+        """Show the diagnosis for data, replacing whatever the window showed before."""
+        for button_info in self.elements["button_frame_pop"].winfo_children():
+            button_info.destroy()
+        for i, disease in enumerate(data):
+            button_info = ttk.Button(self.elements["button_frame_pop"], text=f"{disease}",
+                                     command=partial(self.show_info, disease))
+            button_info.grid(row=0, column=i, sticky="ew", padx=5)
+        self.elements["lst_box_info"].config(text="")
+        self.update_disease_chart(data)
+        self.pop_up.deiconify()
+        self.pop_up.lift()
+
     def toggle_fullscreen(self, _event: tk.Event = None) -> None:
         """Toggle fullscreen mode."""
-        is_fullscreen = self.pop_up.attributes('-fullscreen')
-        self.pop_up.attributes('-fullscreen', not is_fullscreen)
+        self._is_fullscreen = not self._is_fullscreen
+        self.pop_up.attributes('-fullscreen', self._is_fullscreen)
 
-    def create_disease_chart(self, data: dict) -> None:
-        """Create a chart based on the probabilities of the possible diseases"""
+    def create_disease_chart(self) -> None:
+        """Create the empty canvas that will chart the probabilities of the possible diseases"""
         self.elements["frame_chart"] = ttk.Frame(self.pop_up)
         self.elements["frame_chart"].grid(row=0, column=0, sticky="nsew", padx=20, pady=15)
-        self.elements["fig"] = Figure(figsize=(4, 4), dpi=80, facecolor="#C7D9DD")
-        ax = self.elements["fig"].add_subplot(111)
-
-        categories = list(data.keys())
-        values = list(data.values())
-
-        ax.bar(categories, values, color=['blue', 'green', 'red', 'purple'])
-
-        ax.set_title("Disease probabilities")
-        ax.set_xlabel("Disease Name")
-        ax.set_ylabel("Percentage")
-        ax.set_ylim(0, 100)
+        self.elements["canvas"] = tk.Canvas(self.elements["frame_chart"], bg="#C7D9DD", highlightthickness=0)
+        self.elements["canvas"].pack(expand=True, fill="both", padx=10, pady=10)
+        self.elements["canvas"].bind("<Configure>", lambda _event: self.draw_chart_idle())
+
+    def update_disease_chart(self, data: dict) -> None:
+        """Redraw the chart based on the probabilities of the possible diseases"""
+        self.chart_data = data
+        self.draw_chart_idle()
+
+    def draw_chart_idle(self) -> None:
+        """Schedule a chart redraw for when Tk is idle, so a burst of resizes only redraws it once."""
+        if self._pending_draw is None:
+            self._pending_draw = self.pop_up.after_idle(self.draw_disease_chart)
+
+    def draw_disease_chart(self) -> None:
+        """Draw a bar chart of chart_data scaled to the current size of the canvas"""
+        self._pending_draw = None
+        canvas = self.elements["canvas"]
+        width, height = canvas.winfo_width(), canvas.winfo_height()
+        left, right, top, bottom = 60, width - 20, 40, height - 50
+
+        # The title, axes and ticks only depend on the size of the canvas, so they are kept
+        # between redraws and only the bars are replaced when the data changes.
+        if (width, height) != self._chart_size:
+            self._chart_size = (width, height)
+            canvas.delete("all")
+            if right <= left or bottom <= top:
+                return
+            canvas.create_text(width / 2, top / 2, text="Disease probabilities", font=("Lexend", 12))
+            canvas.create_text(width / 2, height - 12, text="Disease Name", font=("Lexend", 10))
+            canvas.create_text(15, (top + bottom) / 2, text="Percentage", angle=90, font=("Lexend", 10))
+            for tick in range(0, 101, 20):
+                y = bottom - (bottom - top) * tick / 100
+                canvas.create_line(left - 5, y, left, y)
+                canvas.create_text(left - 8, y, text=str(tick), anchor="e", font=("Lexend", 8))
+            canvas.create_line(left, top, left, bottom, right, bottom)
+        elif right <= left or bottom <= top:
+            return
+        else:
+            canvas.delete("bars")
 
-        self.elements["canvas"] = FigureCanvasTkAgg(self.elements["fig"], master=self.elements["frame_chart"])
-        self.elements["canvas"].draw()
-        self.elements["canvas"].get_tk_widget().pack(expand=True, fill="both", padx=10, pady=10)
+        slot = (right - left) / max(len(self.chart_data), 1)
+        for i, (disease, value) in enumerate(self.chart_data.items()):
+            x = left + slot * i
+            y = bottom - (bottom - top) * min(value, 100) / 100
+            canvas.create_rectangle(x + slot * 0.1, y, x + slot * 0.9, bottom,
+                                    fill=CHART_COLORS[i % len(CHART_COLORS)], width=0, tags="bars")
+            canvas.create_text(x + slot / 2, bottom + 12, text=disease, font=("Lexend", 8), tags="bars")
 
     def show_info(self, selected: str) -> None:
         """Show info related to the selected disease"""
-        self.elements["lst_box_info"].delete(1.0, tk.END)
-        self.elements["lst_box_info"].insert(tk.END, DISEASE_DICT[selected].description + "\n")
-        self.elements["lst_box_info"].insert(tk.END, "-------------------------------------------------------------\n")
-        self.elements["lst_box_info"].insert(tk.END, "Advice:\n")
-        for item in DISEASE_DICT[selected].advice:
-            self.elements["lst_box_info"].insert(tk.END, f"• {item}\n")
-
-
-DIAGNOSIS_GRAPH, SYMPTOMS_LIST, NAME_TO_DISEASE_MAP = backend.load_diagnosis_graph(
-    'Symptom-severity.csv',
-    'dataset.csv',
-    'symptom_Description.csv',
-    'symptom_precaution.csv')
-SYMPTOM_OPTIONS = sorted(SYMPTOMS_LIST.copy())
-DISEASE_DICT = NAME_TO_DISEASE_MAP
+        self.elements["lst_box_info"].config(text=get_disease_info(selected))
+
+
+# Loads the diagnosis data off the UI thread, so the window can appear before the CSV files are read.
+# It is only started once the app runs, so importing this module does not load anything.
+GRAPH_LOADER: Optional[threading.Thread] = None
+# Milliseconds between checks on whether GRAPH_LOADER has finished.
+GRAPH_POLL_DELAY = 50
+# Milliseconds between checks on whether a diagnosis running on the worker thread has finished.
+DIAGNOSIS_POLL_DELAY = 50
+# Milliseconds to wait after the last keystroke before refreshing the dropdown.
+UPDATE_LIST_DELAY = 120
+# Number of rows visible in the symptom dropdown.
+DROPDOWN_HEIGHT = 6
+# Fill colours of the bars in the diagnosis chart, reused in order when there are more bars.
+CHART_COLORS = ('blue', 'green', 'red', 'purple')
 
 if __name__ == '__main__':
     import python_ta
 
     root = tk.Tk()
+    GRAPH_LOADER = threading.Thread(target=backend.get_graph, daemon=True)
+    GRAPH_LOADER.start()
     app = DoctorHouseApp(root)
     root.mainloop()
 
     python_ta.check_all(config={
-        'extra-imports': ['csv', 'matplotlib', 'tkinter', 'backend', 'matplotlib.pyplot', 'matplotlib.figure',
-                          'matplotlib.backends.backend_tkagg'],
+        'extra-imports': ['bisect', 'concurrent.futures', 'functools', 'typing', 'threading', 'csv', 'tkinter',
+                          'backend'],
         'allowed-io': ['print'],
         'max-line-length': 120
     })
@@ -1,8 +1,12 @@
 """Doctor House - Modern Medical Diagnosis Interface (Fixed Version)"""
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import lru_cache
+from types import SimpleNamespace
+import threading
 import tkinter as tk
-from tkinter import ttk, messagebox
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
-from matplotlib.figure import Figure
+from tkinter import ttk, messagebox, font as tkfont
+from PIL import Image, ImageTk
 import backend
 
 
@@ -14,71 +18,77 @@ class ModernDoctorHouseApp:
         self.root.title("Doctor House - AI Medical Diagnosis System")
         self.root.geometry("1200x800")
         self.widgets = {}
-
-        # Color Palette - Medical Professional Theme (centralized)
-        self.colors = {
-            'primary': '#2C3E50',
-            'secondary': '#3498DB',
-            'accent': '#E74C3C',
-            'success': '#27AE60',
-            'warning': '#F39C12',
-            'bg_main': '#ECF0F1',
-            'bg_card': '#FFFFFF',
-            'text_dark': '#2C3E50',
-            'text_light': '#7F8C8D',
-            'border': '#BDC3C7',
-            'hover': '#3498DB',
-            'shadow': '#95A5A6'
-        }
+        self._last_typed = None  # Entry text the dropdown was last filtered by
+        self._update_job = None  # Pending debounced update_list call, if any
+        self._last_filtered = []  # Symptoms currently listed in the dropdown
+        self._selected_set = set()  # Symptoms currently in the selected symptoms list
+        self._diagnosis_cache = OrderedDict()  # Recent diagnoses, least recently used first
+        self._click_binding = None  # Root <Button-1> binding id while the dropdown is shown
+        self._diagnosis_window = None  # Results window, reused for every diagnosis once created
+        self._is_fullscreen = True  # Whether the window is fullscreen, so toggling needs no query
 
         self.root.attributes('-fullscreen', True)
         self.root.bind("<Escape>", self.toggle_fullscreen)
         self.root.bind("<F1>", self.show_help)
         self.root.bind('<Configure>', self.on_window_configure)
-        self.root.config(bg=self.colors['bg_main'])
+        self.root.config(bg=COLORS.bg_main)
 
+        init_fonts(self.root)
         self.setup_styles()
         self.create_header()
         self.create_main_content()
         self.create_footer()
 
+        # The symptom data is still loading on DATA_LOADER, so keep the search disabled until then
+        self.widgets["entry"].config(state='disabled')
+        self.widgets["label_error"].config(text="⏳ Loading symptom data...", fg=COLORS.text_light)
+        self.root.after(DATA_POLL_DELAY, self.check_data_loaded)
+
+    def check_data_loaded(self) -> None:
+        """Enable the symptom search once DATA_LOADER has finished, checking again later if not"""
+        if DATA_LOADER is not None and DATA_LOADER.is_alive():
+            self.root.after(DATA_POLL_DELAY, self.check_data_loaded)
+            return
+        self.widgets["entry"].config(state='normal')
+        self.widgets["label_error"].config(text="")
+
     def setup_styles(self) -> None:
         """Configure modern ttk styles with proper state handling"""
         style = ttk.Style(self.root)
         style.theme_use('clam')
 
         # Frame styles
-        style.configure('Main.TFrame', background=self.colors['bg_main'])
-        style.configure('Card.TFrame', background=self.colors['bg_card'], relief='flat')
-        style.configure('Header.TFrame', background=self.colors['primary'])
+        style.configure('Main.TFrame', background=COLORS.bg_main)
+        style.configure('Card.TFrame', background=COLORS.bg_card, relief='flat')
+        style.configure('Header.TFrame', background=COLORS.primary)
 
         # Label styles
         style.configure('Title.TLabel',
-                        background=self.colors['primary'],
+                        background=COLORS.primary,
                         foreground='white',
-                        font=('Segoe UI', 28, 'bold'))
+                        font=FONTS['28 bold'])
 
         style.configure('Subtitle.TLabel',
-                        background=self.colors['primary'],
+                        background=COLORS.primary,
                         foreground='#BDC3C7',
-                        font=('Segoe UI', 11))
+                        font=FONTS['11'])
 
         style.configure('CardTitle.TLabel',
-                        background=self.colors['bg_card'],
-                        foreground=self.colors['text_dark'],
-                        font=('Segoe UI', 14, 'bold'))
+                        background=COLORS.bg_card,
+                        foreground=COLORS.text_dark,
+                        font=FONTS['14 bold'])
 
         style.configure('Hint.TLabel',
-                        background=self.colors['bg_card'],
-                        foreground=self.colors['text_light'],
-                        font=('Segoe UI', 9, 'italic'))
+                        background=COLORS.bg_card,
+                        foreground=COLORS.text_light,
+                        font=FONTS['9 italic'])
 
         # Button styles with proper disabled state
         style.configure('Primary.TButton',
-                        background=self.colors['secondary'],
+                        background=COLORS.secondary,
                         foreground='white',
                         borderwidth=0,
-                        font=('Segoe UI', 11, 'bold'),
+                        font=FONTS['11 bold'],
                         padding=(20, 12))
 
         style.map('Primary.TButton',
@@ -88,10 +98,10 @@ class ModernDoctorHouseApp:
                   relief=[('pressed', 'flat')])
 
         style.configure('Danger.TButton',
-                        background=self.colors['accent'],
+                        background=COLORS.accent,
                         foreground='white',
                         borderwidth=0,
-                        font=('Segoe UI', 11, 'bold'),
+                        font=FONTS['11 bold'],
                         padding=(20, 12))
 
         style.map('Danger.TButton',
@@ -101,15 +111,15 @@ class ModernDoctorHouseApp:
 
         style.configure('Secondary.TButton',
                         background='white',
-                        foreground=self.colors['text_dark'],
+                        foreground=COLORS.text_dark,
                         borderwidth=1,
-                        font=('Segoe UI', 10),
+                        font=FONTS['10'],
                         padding=(15, 8))
 
         style.map('Secondary.TButton',
-                  background=[('active', self.colors['bg_main']), ('disabled', '#ECF0F1')],
+                  background=[('active', COLORS.bg_main), ('disabled', '#ECF0F1')],
                   foreground=[('disabled', '#BDC3C7')],
-                  bordercolor=[('active', self.colors['secondary'])])
+                  bordercolor=[('active', COLORS.secondary)])
 
     def create_header(self) -> None:
         """Create professional header with branding"""
@@ -127,9 +137,9 @@ class ModernDoctorHouseApp:
         # Medical cross icon (replaced emoji with text symbol for consistency)
         logo_label = tk.Label(logo_frame,
                               text="⚕",
-                              font=('Segoe UI', 48),
-                              bg=self.colors['primary'],
-                              fg=self.colors['accent'])
+                              font=FONTS['48'],
+                              bg=COLORS.primary,
+                              fg=COLORS.accent)
         logo_label.pack(side=tk.LEFT, padx=(0, 15))
 
         # Title section
@@ -175,79 +185,77 @@ class ModernDoctorHouseApp:
         self.create_selection_card(main_frame)
 
     def create_symptom_card(self, parent: ttk.Frame) -> None:
-        """Create left card for symptom search with improved shadow"""
+        """Create left card for symptom search"""
         card_container = ttk.Frame(parent, style='Main.TFrame')
         card_container.grid(row=0, column=0, sticky='nsew', padx=(0, 15))
 
-        # Improved shadow using canvas instead of frame
-        shadow_canvas = tk.Canvas(card_container, bg=self.colors['bg_main'],
-                                  highlightthickness=0, bd=0)
-        shadow_canvas.place(x=0, y=0, relwidth=1, relheight=1)
-
         # Main card with slight elevation
-        card = tk.Frame(card_container, bg=self.colors['bg_card'],
-                        highlightbackground=self.colors['border'],
+        card = tk.Frame(card_container, bg=COLORS.bg_card,
+                        highlightbackground=COLORS.border,
                         highlightthickness=1)
         card.place(x=0, y=0, relwidth=0.98, relheight=0.98)
 
         # Card header
-        header = tk.Frame(card, bg=self.colors['bg_card'])
+        header = tk.Frame(card, bg=COLORS.bg_card)
         header.pack(fill=tk.X, padx=30, pady=(30, 10))
 
         # Replaced emoji with descriptive text for cross-platform compatibility
         card_title = tk.Label(header,
                               text="🔍 Search Symptoms",
-                              bg=self.colors['bg_card'],
-                              fg=self.colors['text_dark'],
-                              font=('Segoe UI', 14, 'bold'))
+                              bg=COLORS.bg_card,
+                              fg=COLORS.text_dark,
+                              font=FONTS['14 bold'])
         card_title.pack(anchor='w')
 
         hint = tk.Label(header,
                         text="Type to search from 133 medical symptoms",
-                        bg=self.colors['bg_card'],
-                        fg=self.colors['text_light'],
-                        font=('Segoe UI', 9, 'italic'))
+                        bg=COLORS.bg_card,
+                        fg=COLORS.text_light,
+                        font=FONTS['9 italic'])
         hint.pack(anchor='w', pady=(5, 0))
 
         # Search input container
-        input_container = tk.Frame(card, bg=self.colors['bg_card'])
+        input_container = tk.Frame(card, bg=COLORS.bg_card)
         input_container.pack(fill=tk.X, padx=30, pady=15)
 
         # Custom styled entry with focus feedback
         self.widgets["entry_frame"] = tk.Frame(input_container,
-                                               bg=self.colors['bg_main'],
-                                               highlightbackground=self.colors['border'],
+                                               bg=COLORS.bg_main,
+                                               highlightbackground=COLORS.border,
                                                highlightthickness=2,
-                                               highlightcolor=self.colors['secondary'])
+                                               highlightcolor=COLORS.secondary)
         self.widgets["entry_frame"].pack(fill=tk.X)
 
         # Search icon (text-based for consistency)
         search_icon = tk.Label(self.widgets["entry_frame"],
                                text="🔎",
-                               bg=self.colors['bg_main'],
-                               font=('Segoe UI', 14))
+                               bg=COLORS.bg_main,
+                               font=FONTS['14'])
         search_icon.pack(side=tk.LEFT, padx=(10, 5))
 
+        # Any edit of the entry text, whether typed, pasted or cut, refreshes the dropdown
+        self.widgets["entry_text"] = tk.StringVar(self.root)
+        self.widgets["entry_text"].trace_add("write", lambda *_args: self.schedule_update_list())
         self.widgets["entry"] = tk.Entry(self.widgets["entry_frame"],
-                                         bg=self.colors['bg_main'],
-                                         fg=self.colors['text_dark'],
-                                         font=('Segoe UI', 12),
+                                         textvariable=self.widgets["entry_text"],
+                                         bg=COLORS.bg_main,
+                                         fg=COLORS.text_dark,
+                                         font=FONTS['12'],
                                          bd=0,
-                                         insertbackground=self.colors['secondary'])
+                                         insertbackground=COLORS.secondary)
         self.widgets["entry"].pack(side=tk.LEFT, fill=tk.BOTH, expand=True, padx=5, pady=12)
 
-        self.widgets["entry"].bind("<KeyRelease>", self.update_list)
         self.widgets["entry"].bind("<FocusIn>", self.on_entry_focus)
         self.widgets["entry"].bind("<FocusOut>", self.on_entry_unfocus)
         self.widgets["entry"].bind("<Down>", self.focus_dropdown)
         self.widgets["entry"].bind("<Return>", self.select_first_dropdown_item)
 
         # Info section
-        info_frame = tk.Frame(card, bg=self.colors['bg_card'])
+        info_frame = tk.Frame(card, bg=COLORS.bg_card)
         info_frame.pack(fill=tk.BOTH, expand=True, padx=30, pady=20)
 
         # Statistics cards
-        stats_container = tk.Frame(info_frame, bg=self.colors['bg_card'])
+        stats_container = tk.Frame(info_frame, bg=COLORS.bg_card)
         stats_container.pack(fill=tk.X, pady=10)
 
         self.create_stat_box(stats_container, "133", "Total Symptoms", 0)
@@ -255,14 +263,14 @@ class ModernDoctorHouseApp:
         self.create_stat_box(stats_container, "AI", "Powered", 2)
 
         # Instructions
-        instructions_frame = tk.Frame(info_frame, bg=self.colors['bg_card'])
+        instructions_frame = tk.Frame(info_frame, bg=COLORS.bg_card)
         instructions_frame.pack(fill=tk.BOTH, expand=True, pady=20)
 
         instructions_title = tk.Label(instructions_frame,
                                       text="How to Use:",
-                                      bg=self.colors['bg_card'],
-                                      fg=self.colors['text_dark'],
-                                      font=('Segoe UI', 12, 'bold'))
+                                      bg=COLORS.bg_card,
+                                      fg=COLORS.text_dark,
+                                      font=FONTS['12 bold'])
         instructions_title.pack(anchor='w', pady=(0, 10))
 
         instructions = [
@@ -277,9 +285,9 @@ class ModernDoctorHouseApp:
         for instruction in instructions:
             label = tk.Label(instructions_frame,
                              text=instruction,
-                             bg=self.colors['bg_card'],
-                             fg=self.colors['text_light'],
-                             font=('Segoe UI', 10),
+                             bg=COLORS.bg_card,
+                             fg=COLORS.text_light,
+                             font=FONTS['10'],
                              anchor='w',
                              justify='left')
             label.pack(anchor='w', pady=2)
@@ -289,16 +297,19 @@ class ModernDoctorHouseApp:
                                                   bg='white',
                                                   relief=tk.SOLID,
                                                   bd=1,
-                                                  highlightbackground=self.colors['border'],
+                                                  highlightbackground=COLORS.border,
                                                   highlightthickness=0)
 
+        # The dropdown's items are replaced as a whole through this variable
+        self.widgets["dropdown_var"] = tk.StringVar(value=())
         self.widgets["listbox"] = tk.Listbox(self.widgets["dropdown_frame"],
+                                             listvariable=self.widgets["dropdown_var"],
                                              height=8,
                                              bg='white',
-                                             fg=self.colors['text_dark'],
-                                             selectbackground=self.colors['secondary'],
+                                             fg=COLORS.text_dark,
+                                             selectbackground=COLORS.secondary,
                                              selectforeground='white',
-                                             font=('Segoe UI', 10),
+                                             font=FONTS['10'],
                                              bd=0,
                                              highlightthickness=0,
                                              activestyle='dotbox')
@@ -312,55 +323,52 @@ class ModernDoctorHouseApp:
         card_container = ttk.Frame(parent, style='Main.TFrame')
         card_container.grid(row=0, column=1, sticky='nsew', padx=(15, 0))
 
-        # Improved shadow
-        shadow_canvas = tk.Canvas(card_container, bg=self.colors['bg_main'],
-                                  highlightthickness=0, bd=0)
-        shadow_canvas.place(x=0, y=0, relwidth=1, relheight=1)
-
         # Main card
-        card = tk.Frame(card_container, bg=self.colors['bg_card'],
-                        highlightbackground=self.colors['border'],
+        card = tk.Frame(card_container, bg=COLORS.bg_card,
+                        highlightbackground=COLORS.border,
                         highlightthickness=1)
         card.place(x=0, y=0, relwidth=0.98, relheight=0.98)
 
         # Card header
-        header = tk.Frame(card, bg=self.colors['bg_card'])
+        header = tk.Frame(card, bg=COLORS.bg_card)
         header.pack(fill=tk.X, padx=30, pady=(30, 10))
 
         card_title = tk.Label(header,
                               text="✓ Selected Symptoms",
-                              bg=self.colors['bg_card'],
-                              fg=self.colors['text_dark'],
-                              font=('Segoe UI', 14, 'bold'))
+                              bg=COLORS.bg_card,
+                              fg=COLORS.text_dark,
+                              font=FONTS['14 bold'])
         card_title.pack(anchor='w')
 
         # Symptom count
         self.widgets["count_label"] = tk.Label(header,
                                                text="0 symptoms selected",
-                                               bg=self.colors['bg_card'],
-                                               fg=self.colors['text_light'],
-                                               font=('Segoe UI', 9))
+                                               bg=COLORS.bg_card,
+                                               fg=COLORS.text_light,
+                                               font=FONTS['9'])
         self.widgets["count_label"].pack(anchor='w', pady=(5, 0))
 
         # Selected symptoms list with modern styling
-        list_container = tk.Frame(card, bg=self.colors['bg_card'])
+        list_container = tk.Frame(card, bg=COLORS.bg_card)
         list_container.pack(fill=tk.BOTH, expand=True, padx=30, pady=15)
 
         # Custom scrollbar
-        list_frame = tk.Frame(list_container, bg=self.colors['bg_main'])
+        list_frame = tk.Frame(list_container, bg=COLORS.bg_main)
         list_frame.pack(fill=tk.BOTH, expand=True)
 
-        scrollbar = tk.Scrollbar(list_frame, bg=self.colors['bg_card'])
+        scrollbar = tk.Scrollbar(list_frame, bg=COLORS.bg_card)
         scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
 
+        self.widgets["lst_box_var"] = tk.StringVar(value=())
         self.widgets["lst_box"] = tk.Listbox(list_frame,
-                                             bg=self.colors['bg_main'],
-                                             fg=self.colors['text_dark'],
-                                             font=('Segoe UI', 11),
+                                             listvariable=self.widgets["lst_box_var"],
+                                             bg=COLORS.bg_main,
+                                             fg=COLORS.text_dark,
+                                             font=FONTS['11'],
                                              bd=0,
                                              highlightthickness=1,
-                                             highlightbackground=self.colors['border'],
-                                             selectbackground=self.colors['secondary'],
+                                             highlightbackground=COLORS.border,
+                                             selectbackground=COLORS.secondary,
                                              selectforeground='white',
                                              yscrollcommand=scrollbar.set,
                                              activestyle='dotbox')
@@ -370,7 +378,7 @@ class ModernDoctorHouseApp:
         scrollbar.config(command=self.widgets["lst_box"].yview)
 
         # Action buttons
-        button_frame = tk.Frame(card, bg=self.colors['bg_card'])
+        button_frame = tk.Frame(card, bg=COLORS.bg_card)
         button_frame.pack(fill=tk.X, padx=30, pady=(10, 30))
 
         self.widgets["btn_remove"] = ttk.Button(button_frame,
@@ -394,53 +402,53 @@ class ModernDoctorHouseApp:
         # Error/Success label
         self.widgets["label_error"] = tk.Label(button_frame,
                                                text="",
-                                               bg=self.colors['bg_card'],
-                                               fg=self.colors['accent'],
-                                               font=('Segoe UI', 10, 'bold'),
+                                               bg=COLORS.bg_card,
+                                               fg=COLORS.accent,
+                                               font=FONTS['10 bold'],
                                                wraplength=350)
         self.widgets["label_error"].pack(pady=(10, 0))
 
     def create_stat_box(self, parent: tk.Frame, value: str, label: str, column: int) -> None:
         """Create a statistics display box"""
         stat_frame = tk.Frame(parent,
-                              bg=self.colors['bg_main'],
-                              highlightbackground=self.colors['border'],
+                              bg=COLORS.bg_main,
+                              highlightbackground=COLORS.border,
                               highlightthickness=1)
         stat_frame.grid(row=0, column=column, sticky='ew', padx=5)
         parent.columnconfigure(column, weight=1)
 
         value_label = tk.Label(stat_frame,
                                text=value,
-                               bg=self.colors['bg_main'],
-                               fg=self.colors['secondary'],
-                               font=('Segoe UI', 20, 'bold'))
+                               bg=COLORS.bg_main,
+                               fg=COLORS.secondary,
+                               font=FONTS['20 bold'])
         value_label.pack(pady=(10, 0))
 
         text_label = tk.Label(stat_frame,
                               text=label,
-                              bg=self.colors['bg_main'],
-                              fg=self.colors['text_light'],
-                              font=('Segoe UI', 9))
+                              bg=COLORS.bg_main,
+                              fg=COLORS.text_light,
+                              font=FONTS['9'])
         text_label.pack(pady=(0, 10))
 
     def create_footer(self) -> None:
         """Create footer with disclaimer - improved visibility"""
-        footer = tk.Frame(self.root, bg=self.colors['primary'], height=60)
+        footer = tk.Frame(self.root, bg=COLORS.primary, height=60)
         footer.pack(fill=tk.X, side=tk.BOTTOM)
         footer.pack_propagate(False)
 
         disclaimer = tk.Label(footer,
                               text="⚠ IMPORTANT DISCLAIMER: This tool is for educational purposes only. "
                                    "Always consult qualified healthcare professionals for medical advice and diagnosis.",
-                              bg=self.colors['primary'],
+                              bg=COLORS.primary,
                               fg='#ECF0F1',
-                              font=('Segoe UI', 10, 'bold'),
+                              font=FONTS['10 bold'],
                               wraplength=1100)
         disclaimer.pack(expand=True, pady=10)
 
     def on_window_configure(self, _event: tk.Event = None) -> None:
         """Reposition dropdown when window is resized or moved"""
-        if self.widgets.get("dropdown_frame") and self.widgets["dropdown_frame"].winfo_ismapped():
+        if self._click_binding is not None:
             self.position_dropdown()
 
     def position_dropdown(self) -> None:
@@ -458,15 +466,29 @@ class ModernDoctorHouseApp:
             # Widget not ready, skip positioning
             pass
 
+    def show_dropdown(self) -> None:
+        """Place the dropdown and start listening for clicks outside it"""
+        self.position_dropdown()
+        if self._click_binding is None:
+            self._click_binding = self.root.bind('<Button-1>', self.hide_dropdown, add='+')
+
+    def forget_dropdown(self) -> None:
+        """Hide the dropdown and stop listening for clicks outside it"""
+        self.widgets["dropdown_frame"].place_forget()
+        if self._click_binding is not None:
+            self.root.unbind('<Button-1>', self._click_binding)
+            self._click_binding = None
+
     def on_entry_focus(self, _event: tk.Event = None) -> None:
         """Visual feedback when entry gets focus"""
-        self.widgets["entry_frame"].config(highlightcolor=self.colors['secondary'],
+        self.widgets["entry_frame"].config(highlightcolor=COLORS.secondary,
                                            highlightthickness=2)
+        self._last_typed = None  # The dropdown may have been hidden since, so always refresh it
         self.update_list()
 
     def on_entry_unfocus(self, _event: tk.Event = None) -> None:
         """Visual feedback when entry loses focus"""
-        self.widgets["entry_frame"].config(highlightcolor=self.colors['border'],
+        self.widgets["entry_frame"].config(highlightcolor=COLORS.border,
                                            highlightthickness=2)
 
     def focus_dropdown(self, _event: tk.Event = None) -> None:
@@ -486,89 +508,101 @@ class ModernDoctorHouseApp:
 
     def update_symptom_count(self) -> None:
         """Update the symptom count label"""
-        count = self.widgets["lst_box"].size()
+        count = len(self._selected_set)
         text = f"{count} symptom{'s' if count != 1 else ''} selected"
         self.widgets["count_label"].config(text=text)
 
     def toggle_fullscreen(self, _event: tk.Event = None) -> None:
         """Toggle fullscreen mode"""
-        is_fullscreen = self.root.attributes('-fullscreen')
-        self.root.attributes('-fullscreen', not is_fullscreen)
+        self._is_fullscreen = not self._is_fullscreen
+        self.root.attributes('-fullscreen', self._is_fullscreen)
+
+    def schedule_update_list(self, _event: tk.Event = None) -> None:
+        """Update the dropdown shortly after typing pauses, so a burst of keys updates it once"""
+        if self._update_job is not None:
+            self.root.after_cancel(self._update_job)
+        self._update_job = self.root.after(UPDATE_LIST_DELAY, self.update_list)
 
     def update_list(self, _event: tk.Event = None) -> None:
         """Update dropdown list based on user input with dynamic positioning"""
+        self._update_job = None
         typed = self.widgets["entry"].get().lower()
-        self.widgets["listbox"].delete(0, tk.END)
-
-        if not typed:
-            self.widgets["dropdown_frame"].place_forget()
+        if typed == self._last_typed:
             return
+        self._last_typed = typed
+
+        filtered = find_symptoms(typed) if typed else []
 
-        filtered = [symptom for symptom in SYMPTOM_OPTIONS if typed in symptom.lower()]
+        # Only touch the listbox when the matches changed, and then in a single update
+        if filtered != self._last_filtered:
+            self.widgets["dropdown_var"].set(tuple(filtered))
+            self._last_filtered = filtered
 
         if filtered:
-            for item in filtered:
-                self.widgets["listbox"].insert(tk.END, item)
-            self.position_dropdown()
+            self.show_dropdown()
         else:
-            self.widgets["dropdown_frame"].place_forget()
+            self.forget_dropdown()
 
     def select_option(self, _event: tk.Event) -> None:
         """Select symptom from dropdown - prevent duplicates"""
-        if not self.widgets["listbox"].curselection():
+        selection = self.widgets["listbox"].curselection()
+        if not selection:
             return
 
-        selected = self.widgets["listbox"].get(self.widgets["listbox"].curselection())
+        selected = self.widgets["listbox"].get(selection[0])
 
         # Check for duplicates
-        current_items = self.widgets["lst_box"].get(0, tk.END)
-        if selected in current_items:
+        if selected in self._selected_set:
             self.show_error("⚠ Symptom already added!", 2000)
             self.widgets["entry"].delete(0, tk.END)
-            self.widgets["dropdown_frame"].place_forget()
+            self.forget_dropdown()
             return
 
         self.widgets["entry"].delete(0, tk.END)
         self.widgets["lst_box"].insert(tk.END, selected)
+        self._selected_set.add(selected)
         self.update_symptom_count()
-        self.widgets["dropdown_frame"].place_forget()
+        self.forget_dropdown()
         self.widgets["entry"].focus_set()
 
     def hide_dropdown(self, event: tk.Event) -> None:
         """Hide dropdown when clicking outside"""
         if event.widget not in (self.widgets["entry"], self.widgets["listbox"],
-                                self.widgets["entry_frame"]):
-            self.widgets["dropdown_frame"].place_forget()
+                                self.widgets["entry_frame"], self.widgets["dropdown_frame"]):
+            self.forget_dropdown()
 
     def remove_selected_symptom(self, _event: tk.Event = None) -> None:
         """Remove the currently selected symptom from the list"""
         selection = self.widgets["lst_box"].curselection()
         if selection:
+            self._selected_set.discard(self.widgets["lst_box"].get(selection[0]))
             self.widgets["lst_box"].delete(selection[0])
             self.update_symptom_count()
 
     def clear_lst_box(self) -> None:
         """Clear selected symptoms with confirmation"""
-        if self.widgets["lst_box"].size() > 0:
+        if self._selected_set:
             response = messagebox.askyesno("Confirm Clear",
                                            "Are you sure you want to clear all selected symptoms?")
             if response:
-                self.widgets["lst_box"].delete(0, tk.END)
-                self.update_symptom_count()
+                self.clear_lst_box_silent()
 
     def clear_lst_box_silent(self) -> None:
         """Clear the list box without confirmation (used after diagnosis)"""
-        self.widgets["lst_box"].delete(0, tk.END)
-        self.update_symptom_count()
+        if not self._selected_set:
+            return  # Already empty, nothing to redraw
+        self._selected_set.clear()
+        self.widgets["lst_box_var"].set(())
+        self.widgets["count_label"].config(text="0 symptoms selected")
 
     def show_error(self, message: str, duration: int = 3000) -> None:
         """Show error message for specified duration"""
-        self.widgets["label_error"].config(text=message, fg=self.colors['accent'])
+        self.widgets["label_error"].config(text=message, fg=COLORS.accent)
         self.root.after(duration, lambda: self.widgets["label_error"].config(text=""))
 
     def show_success(self, message: str, duration: int = 2000) -> None:
         """Show success message for specified duration"""
-        self.widgets["label_error"].config(text=message, fg=self.colors['success'])
+        self.widgets["label_error"].config(text=message, fg=COLORS.success)
         self.root.after(duration, lambda: self.widgets["label_error"].config(text=""))
 
     def check_diagnosis(self) -> None:
@@ -586,13 +620,16 @@ class ModernDoctorHouseApp:
         self.root.update()
 
         try:
-            result = backend.calculate_potential_disease(DIAGNOSIS_GRAPH, patient_symptoms)
+            result = self.diagnose(patient_symptoms)
 
             if not result:
                 self.show_error("Unable to determine diagnosis. Please try different symptoms.", 3000)
                 return
 
-            ModernDiagnosisWindow(self.root, result)
+            if self._diagnosis_window is None or not self._diagnosis_window.pop_up.winfo_exists():
+                self._diagnosis_window = ModernDiagnosisWindow(self.root, result)
+            else:
+                self._diagnosis_window.set_data(result)
             self.clear_lst_box_silent()
             self.show_success("✓ Diagnosis completed successfully", 2000)
 
@@ -604,6 +641,22 @@ class ModernDoctorHouseApp:
             self.widgets["btn_clear"].config(state='normal')
             self.widgets["btn_remove"].config(state='normal')
 
+    def diagnose(self, patient_symptoms: list) -> dict:
+        """Return the diagnosis for patient_symptoms, reusing it if the same symptoms were
+        diagnosed recently"""
+        # The order of the symptoms can change the scores, so it is part of the key
+        key = tuple(patient_symptoms)
+        if key in self._diagnosis_cache:
+            self._diagnosis_cache.move_to_end(key)
+            return self._diagnosis_cache[key]
+
+        diagnosis_graph, _, _ = backend.get_graph()
+        result = backend.calculate_potential_disease(diagnosis_graph, patient_symptoms)
+        self._diagnosis_cache[key] = result
+        if len(self._diagnosis_cache) > DIAGNOSIS_CACHE_SIZE:
+            self._diagnosis_cache.popitem(last=False)
+        return result
+
     def show_help(self, _event: tk.Event = None) -> None:
         """Show help dialog - accessible"""
         help_text = """Doctor House - AI Medical Diagnosis System
@@ -660,25 +713,25 @@ Database: 133 symptoms • 41 diseases"""
         icon = tk.Label(content,
                         text="⚕",
                         bg='white',
-                        fg=self.colors['primary'],
-                        font=('Segoe UI', 48))
+                        fg=COLORS.primary,
+                        font=FONTS['48'])
         icon.pack(pady=(0, 10))
 
         title = tk.Label(content,
                          text="Doctor House",
                          bg='white',
-                         fg=self.colors['primary'],
-                         font=('Segoe UI', 24, 'bold'))
+                         fg=COLORS.primary,
+                         font=FONTS['24 bold'])
         title.pack(pady=(0, 5))
 
         version = tk.Label(content,
                            text="Version 2.0 | AI Medical Diagnosis",
                            bg='white',
-                           fg=self.colors['text_light'],
-                           font=('Segoe UI', 10))
+                           fg=COLORS.text_light,
+                           font=FONTS['10'])
         version.pack()
 
-        separator = tk.Frame(content, bg=self.colors['border'], height=1)
+        separator = tk.Frame(content, bg=COLORS.border, height=1)
         separator.pack(fill=tk.X, pady=20)
 
         about_text = """This application uses graph algorithms and 
@@ -700,16 +753,16 @@ for medical advice and treatment.
         text_label = tk.Label(content,
                               text=about_text,
                               bg='white',
-                              fg=self.colors['text_dark'],
-                              font=('Segoe UI', 10),
+                              fg=COLORS.text_dark,
+                              font=FONTS['10'],
                               justify='center')
         text_label.pack(pady=15)
 
         close_btn = tk.Button(content,
                               text="Close",
-                              bg=self.colors['secondary'],
+                              bg=COLORS.secondary,
                               fg='white',
-                              font=('Segoe UI', 11, 'bold'),
+                              font=FONTS['11 bold'],
                               bd=0,
                               padx=30,
                               pady=10,
@@ -722,61 +775,71 @@ class ModernDiagnosisWindow:
     """Modern diagnosis results window - All issues fixed"""
 
     def __init__(self, parent: tk.Tk, data: dict) -> None:
-        """Create modern diagnosis window"""
+        """Create modern diagnosis window showing data"""
         self.pop_up = tk.Toplevel(parent)
         self.pop_up.title("Doctor House - Diagnosis Results")
         self.pop_up.geometry("1200x800")
         self.elements = {}
-
-        # Color scheme matching main app
-        self.colors = {
-            'primary': '#2C3E50',
-            'secondary': '#3498DB',
-            'accent': '#E74C3C',
-            'success': '#27AE60',
-            'warning': '#F39C12',
-            'bg_main': '#ECF0F1',
-            'bg_card': '#FFFFFF',
-            'text_dark': '#2C3E50',
-            'text_light': '#7F8C8D',
-            'border': '#BDC3C7'
-        }
+        self._disease_text_cache = {}  # Disease name -> segments built by build_info_segments
+        self._chart_future = None  # Rendering of the chart for the data currently shown
+        self._chart_data = {}  # Probabilities of the diseases currently charted
+        self._chart_size = (0, 0)  # Width and height the chart was last rendered at
+        self._resize_job = None  # Pending debounced re-rendering of the chart, if any
+        self._buttons_job = None  # Pending after_idle call adding the remaining disease buttons
+        self._shown_disease = None  # Disease whose information is in the info text, if any
+        self._is_fullscreen = True  # Whether the window is fullscreen, so toggling needs no query
 
         self.pop_up.attributes('-fullscreen', True)
         self.pop_up.bind("<Escape>", self.toggle_fullscreen)
         self.pop_up.bind("<F1>", self.show_help)
-        self.pop_up.config(bg=self.colors['bg_main'])
-
-        # Make modal
+        self.pop_up.config(bg=COLORS.bg_main)
+        # Closing only hides the window, so the next diagnosis can reuse its widgets
+        self.pop_up.protocol("WM_DELETE_WINDOW", self.close)
         self.pop_up.transient(parent)
-        self.pop_up.grab_set()
 
         self.create_header()
-        self.create_results_content(data)
+        self.create_results_content()
         self.create_footer()
+        self.set_data(data)
+
+    def set_data(self, data: dict) -> None:
+        """Show the diagnosis data in this window and bring it up as a modal window"""
+        self.show_chart(data)
+        self.show_disease_buttons(data)
+        self.show_placeholder_info()
+
+        self.pop_up.deiconify()
+        self.pop_up.lift()
+        # Make modal
+        self.pop_up.grab_set()
+
+    def close(self) -> None:
+        """Hide the window until the next diagnosis"""
+        self.pop_up.grab_release()
+        self.pop_up.withdraw()
 
     def create_header(self) -> None:
         """Create results header"""
-        header = tk.Frame(self.pop_up, bg=self.colors['primary'], height=100)
+        header = tk.Frame(self.pop_up, bg=COLORS.primary, height=100)
         header.pack(fill=tk.X)
         header.pack_propagate(False)
 
-        content = tk.Frame(header, bg=self.colors['primary'])
+        content = tk.Frame(header, bg=COLORS.primary)
         content.pack(fill=tk.BOTH, expand=True, padx=40, pady=20)
 
         title = tk.Label(content,
                          text="📊 Diagnosis Results",
-                         bg=self.colors['primary'],
+                         bg=COLORS.primary,
                          fg='white',
-                         font=('Segoe UI', 24, 'bold'))
+                         font=FONTS['24 bold'])
         title.pack(side=tk.LEFT)
 
         # Help button
         help_btn = tk.Button(content,
                              text="? Help (F1)",
-                             bg=self.colors['secondary'],
+                             bg=COLORS.secondary,
                              fg='white',
-                             font=('Segoe UI', 10, 'bold'),
+                             font=FONTS['10 bold'],
                              bd=0,
                              padx=15,
                              pady=8,
@@ -786,174 +849,216 @@ class ModernDiagnosisWindow:
 
         close_btn = tk.Button(content,
                               text="✕ Close",
-                              bg=self.colors['accent'],
+                              bg=COLORS.accent,
                               fg='white',
-                              font=('Segoe UI', 11, 'bold'),
+                              font=FONTS['11 bold'],
                               bd=0,
                               padx=20,
                               pady=10,
                               cursor='hand2',
-                              command=self.pop_up.destroy)
+                              command=self.close)
         close_btn.pack(side=tk.RIGHT)
 
-    def create_results_content(self, data: dict) -> None:
+    def create_results_content(self) -> None:
         """Create main results content"""
-        main_frame = tk.Frame(self.pop_up, bg=self.colors['bg_main'])
+        main_frame = tk.Frame(self.pop_up, bg=COLORS.bg_main)
         main_frame.pack(fill=tk.BOTH, expand=True, padx=40, pady=30)
 
         main_frame.columnconfigure(0, weight=1)
         main_frame.columnconfigure(1, weight=1)
         main_frame.rowconfigure(0, weight=1)
 
-        self.create_chart_panel(main_frame, data)
-        self.create_details_panel(main_frame, data)
+        self.create_chart_panel(main_frame)
+        self.create_details_panel(main_frame)
 
-    def create_chart_panel(self, parent: tk.Frame, data: dict) -> None:
+    def create_chart_panel(self, parent: tk.Frame) -> None:
         """Create chart visualization panel - improved with vertical bars"""
-        card_container = tk.Frame(parent, bg=self.colors['bg_main'])
+        card_container = tk.Frame(parent, bg=COLORS.bg_main)
         card_container.grid(row=0, column=0, sticky='nsew', padx=(0, 15))
 
         # Simplified shadow
-        card = tk.Frame(card_container, bg=self.colors['bg_card'],
-                        highlightbackground=self.colors['border'],
+        card = tk.Frame(card_container, bg=COLORS.bg_card,
+                        highlightbackground=COLORS.border,
                         highlightthickness=1)
         card.pack(fill=tk.BOTH, expand=True, padx=2, pady=2)
 
         # Title
-        header = tk.Frame(card, bg=self.colors['bg_card'])
+        header = tk.Frame(card, bg=COLORS.bg_card)
         header.pack(fill=tk.X, padx=30, pady=(30, 10))
 
         title = tk.Label(header,
                          text="Disease Probability Analysis",
-                         bg=self.colors['bg_card'],
-                         fg=self.colors['text_dark'],
-                         font=('Segoe UI', 16, 'bold'))
+                         bg=COLORS.bg_card,
+                         fg=COLORS.text_dark,
+                         font=FONTS['16 bold'])
         title.pack(anchor='w')
 
         subtitle = tk.Label(header,
                             text="Based on your selected symptoms",
-                            bg=self.colors['bg_card'],
-                            fg=self.colors['text_light'],
-                            font=('Segoe UI', 10))
+                            bg=COLORS.bg_card,
+                            fg=COLORS.text_light,
+                            font=FONTS['10'])
         subtitle.pack(anchor='w')
 
         # Chart - using vertical bars for better readability
-        chart_frame = tk.Frame(card, bg=self.colors['bg_card'])
+        chart_frame = tk.Frame(card, bg=COLORS.bg_card)
         chart_frame.pack(fill=tk.BOTH, expand=True, padx=20, pady=20)
-
-        fig = Figure(figsize=(6, 6), dpi=100, facecolor=self.colors['bg_card'])
+        # The chart is rendered to fit the frame, so the image must not make the frame grow
+        chart_frame.pack_propagate(False)
+
+        # Shows the rendered chart, or a placeholder while it is rendering
+        self.elements["chart_label"] = tk.Label(chart_frame,
+                                                bg=COLORS.bg_card,
+                                                fg=COLORS.text_light,
+                                                font=FONTS['11 italic'],
+                                                bd=0,
+                                                highlightthickness=0)
+        self.elements["chart_label"].pack(fill=tk.BOTH, expand=True)
+        self.elements["chart_label"].bind('<Configure>', self.on_chart_configure)
+
+    def show_chart(self, data: dict) -> None:
+        """Render the chart of data on a worker thread, showing a placeholder until it is ready"""
+        self.elements["chart_label"].config(image='', text="Rendering chart...")
+        self._chart_data = data
+        # Until the label has been laid out its size is unknown; on_chart_configure renders then
+        if self._chart_size != (0, 0):
+            self.render_chart_async()
+
+    def on_chart_configure(self, event: tk.Event) -> None:
+        """Re-render the chart at the label's new size shortly after resizing stops"""
+        if (event.width, event.height) == self._chart_size:
+            return
+        self._chart_size = (event.width, event.height)
+        if self._resize_job is not None:
+            self.pop_up.after_cancel(self._resize_job)
+        self._resize_job = self.pop_up.after(CHART_RESIZE_DELAY, self.render_chart_async)
+
+    def render_chart_async(self) -> None:
+        """Render the current chart data at the current chart size on the chart executor"""
+        self._resize_job = None
+        width, height = self._chart_size
+        if not self._chart_data or width < CHART_MIN_SIZE or height < CHART_MIN_SIZE:
+            return
+        self._chart_future = get_chart_executor().submit(self.render_chart, self._chart_data, width, height)
+        self.pop_up.after(CHART_POLL_DELAY, self.install_chart, self._chart_future)
+
+    def render_chart(self, data: dict, width: int, height: int) -> Image.Image:
+        """Build and rasterize the probability chart, width by height pixels, off the Tk thread"""
+        # matplotlib is only imported once a chart is needed, so it does not slow down startup.
+        # Charts are only ever rasterized off-screen, so pin the Agg backend rather than let
+        # matplotlib probe for an interactive one.
+        import matplotlib
+        matplotlib.use('Agg')
+        from matplotlib.backends.backend_agg import FigureCanvasAgg
+        from matplotlib.figure import Figure
+
+        fig = Figure(figsize=(width / CHART_DPI, height / CHART_DPI), dpi=CHART_DPI / CHART_CROP_FACTOR,
+                     facecolor=COLORS.bg_card)
         ax = fig.add_subplot(111)
 
-        categories = list(data.keys())
-        values = list(data.values())
+        categories = tuple(data)
+        values = tuple(data.values())
 
         # Adaptive color gradient based on actual data distribution
         max_val = max(values)
-        colors_list = []
-        for val in values:
-            if val >= max_val * 0.7:  # Top 70% of max
-                colors_list.append(self.colors['accent'])
-            elif val >= max_val * 0.4:  # 40-70% of max
-                colors_list.append(self.colors['warning'])
-            else:
-                colors_list.append(self.colors['secondary'])
+        high, medium = max_val * 0.7, max_val * 0.4  # Top 70% of max, 40-70% of max
+        high_color, medium_color, low_color = (COLORS.accent, COLORS.warning,
+                                               COLORS.secondary)
+        colors_list = [high_color if val >= high else medium_color if val >= medium else low_color
+                       for val in values]
 
         bars = ax.bar(categories, values, color=colors_list, edgecolor='white', linewidth=2)
 
         # Add value labels
-        for bar in bars:
-            height = bar.get_height()
-            ax.text(bar.get_x() + bar.get_width() / 2., height,
-                    f'{height:.1f}%',
-                    ha='center', va='bottom',
-                    fontsize=10, fontweight='bold',
-                    color=self.colors['text_dark'])
-
-        ax.set_ylabel('Probability (%)', fontsize=11, fontweight='bold', color=self.colors['text_dark'])
-        ax.set_xlabel('Disease', fontsize=11, fontweight='bold', color=self.colors['text_dark'])
+        ax.bar_label(bars, fmt='{:.1f}%', fontsize=10, fontweight='bold',
+                     color=COLORS.text_dark)
+
+        ax.set_ylabel('Probability (%)', fontsize=11, fontweight='bold', color=COLORS.text_dark)
+        ax.set_xlabel('Disease', fontsize=11, fontweight='bold', color=COLORS.text_dark)
         ax.set_title('Likelihood Assessment', fontsize=13, fontweight='bold', pad=15,
-                     color=self.colors['text_dark'])
-        ax.set_ylim(0, min(110, max(values) * 1.15))
+                     color=COLORS.text_dark)
+        ax.set_ylim(0, min(110, max_val * 1.15))
 
         # Rotate labels for readability with dark color
-        ax.tick_params(axis='x', rotation=20, labelsize=9, colors=self.colors['text_dark'],
-                       labelcolor=self.colors['text_dark'])
-        ax.tick_params(axis='y', labelsize=9, colors=self.colors['text_dark'],
-                       labelcolor=self.colors['text_dark'])
+        ax.tick_params(axis='x', rotation=20, labelsize=9, colors=COLORS.text_dark,
+                       labelcolor=COLORS.text_dark)
+        ax.tick_params(axis='y', labelsize=9, colors=COLORS.text_dark,
+                       labelcolor=COLORS.text_dark)
 
         # Clean styling
         ax.spines['top'].set_visible(False)
         ax.spines['right'].set_visible(False)
-        ax.spines['left'].set_color(self.colors['text_dark'])
-        ax.spines['bottom'].set_color(self.colors['text_dark'])
-        ax.grid(axis='y', alpha=0.3, linestyle='--', linewidth=0.7, color=self.colors['text_dark'])
+        ax.spines['left'].set_color(COLORS.text_dark)
+        ax.spines['bottom'].set_color(COLORS.text_dark)
+        ax.grid(axis='y', alpha=0.3, linestyle='--', linewidth=0.7, color=COLORS.text_dark)
         ax.set_axisbelow(True)
 
         fig.tight_layout()
 
-        canvas = FigureCanvasTkAgg(fig, master=chart_frame)
-        canvas.draw()
-        canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
+        canvas_agg = FigureCanvasAgg(fig)
+        canvas_agg.draw()
+        # Wrap the rendered RGBA buffer as it is, without a per-pixel channel shuffle, then
+        # scale the reduced-resolution rendering back up to the chart's display size
+        image = Image.frombuffer('RGBA', canvas_agg.get_width_height(), canvas_agg.buffer_rgba(),
+                                 'raw', 'RGBA', 0, 1)
+        if image.size != (width, height):
+            image = image.resize((width, height), Image.Resampling.BILINEAR)
+        return image
+
+    def install_chart(self, future: Future) -> None:
+        """Show the chart rendered by render_chart once it is ready, checking again later if not"""
+        if future is not self._chart_future:
+            return  # Newer data or a new size came along while the chart was rendering
+        if not future.done():
+            self.pop_up.after(CHART_POLL_DELAY, self.install_chart, future)
+            return
+
+        try:
+            image = future.result()
+        except Exception as e:
+            self.elements["chart_image"] = None
+            self.elements["chart_label"].config(image='', text=f"⚠ Unable to render chart: {e}")
+            return
+
+        # The label does not keep a reference to its image, so it is kept in self.elements
+        self.elements["chart_image"] = ImageTk.PhotoImage(image)
+        self.elements["chart_label"].config(image=self.elements["chart_image"], text='')
 
-    def create_details_panel(self, parent: tk.Frame, data: dict) -> None:
+    def create_details_panel(self, parent: tk.Frame) -> None:
         """Create disease details panel"""
-        card_container = tk.Frame(parent, bg=self.colors['bg_main'])
+        card_container = tk.Frame(parent, bg=COLORS.bg_main)
         card_container.grid(row=0, column=1, sticky='nsew', padx=(15, 0))
 
         # Simplified shadow
-        card = tk.Frame(card_container, bg=self.colors['bg_card'],
-                        highlightbackground=self.colors['border'],
+        card = tk.Frame(card_container, bg=COLORS.bg_card,
+                        highlightbackground=COLORS.border,
                         highlightthickness=1)
         card.pack(fill=tk.BOTH, expand=True, padx=2, pady=2)
 
         # Header
-        header = tk.Frame(card, bg=self.colors['bg_card'])
+        header = tk.Frame(card, bg=COLORS.bg_card)
         header.pack(fill=tk.X, padx=30, pady=(30, 10))
 
         title = tk.Label(header,
                          text="Disease Information",
-                         bg=self.colors['bg_card'],
-                         fg=self.colors['text_dark'],
-                         font=('Segoe UI', 16, 'bold'))
+                         bg=COLORS.bg_card,
+                         fg=COLORS.text_dark,
+                         font=FONTS['16 bold'])
         title.pack(anchor='w')
 
         subtitle = tk.Label(header,
                             text="Select a disease to view details",
-                            bg=self.colors['bg_card'],
-                            fg=self.colors['text_light'],
-                            font=('Segoe UI', 10))
+                            bg=COLORS.bg_card,
+                            fg=COLORS.text_light,
+                            font=FONTS['10'])
         subtitle.pack(anchor='w')
 
         # Disease buttons with adaptive color coding
-        button_container = tk.Frame(card, bg=self.colors['bg_card'])
-        button_container.pack(fill=tk.X, padx=30, pady=15)
-
-        max_prob = max(data.values())
-        for i, (disease, prob) in enumerate(data.items()):
-            # Adaptive color based on relative probability
-            if prob >= max_prob * 0.7:
-                bg_color = self.colors['accent']
-            elif prob >= max_prob * 0.4:
-                bg_color = self.colors['warning']
-            else:
-                bg_color = self.colors['secondary']
-
-            btn = tk.Button(button_container,
-                            text=f"{disease} ({prob:.1f}%)",
-                            bg=bg_color,
-                            fg='white',
-                            font=('Segoe UI', 11, 'bold'),
-                            bd=0,
-                            padx=15,
-                            pady=12,
-                            cursor='hand2',
-                            activebackground=self.colors['success'],
-                            activeforeground='white',
-                            command=lambda d=disease: self.show_info(d))
-            btn.pack(fill=tk.X, pady=4)
+        self.elements["button_container"] = tk.Frame(card, bg=COLORS.bg_card)
+        self.elements["button_container"].pack(fill=tk.X, padx=30, pady=15)
 
         # Info display area
-        info_container = tk.Frame(card, bg=self.colors['bg_main'])
+        info_container = tk.Frame(card, bg=COLORS.bg_main)
         info_container.pack(fill=tk.BOTH, expand=True, padx=30, pady=(10, 30))
 
         scrollbar = tk.Scrollbar(info_container)
@@ -961,9 +1066,9 @@ class ModernDiagnosisWindow:
 
         self.elements["info_text"] = tk.Text(info_container,
                                              wrap=tk.WORD,
-                                             bg=self.colors['bg_main'],
-                                             fg=self.colors['text_dark'],
-                                             font=('Segoe UI', 11),
+                                             bg=COLORS.bg_main,
+                                             fg=COLORS.text_dark,
+                                             font=FONTS['11'],
                                              bd=0,
                                              padx=20,
                                              pady=20,
@@ -971,7 +1076,48 @@ class ModernDiagnosisWindow:
         self.elements["info_text"].pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
         scrollbar.config(command=self.elements["info_text"].yview)
 
-        # Initial helpful message
+        # Tags used by show_info
+        self.elements["info_text"].tag_config('title',
+                                              font=FONTS['16 bold'],
+                                              foreground=COLORS.primary)
+        self.elements["info_text"].tag_config('separator',
+                                              foreground=COLORS.border)
+        self.elements["info_text"].tag_config('section',
+                                              font=FONTS['12 bold'],
+                                              foreground=COLORS.secondary,
+                                              spacing1=10)
+        self.elements["info_text"].tag_config('content',
+                                              font=FONTS['11'],
+                                              spacing1=5,
+                                              lmargin1=20,
+                                              lmargin2=35)
+        self.elements["info_text"].tag_config('disclaimer',
+                                              font=FONTS['10 bold'],
+                                              foreground=COLORS.accent,
+                                              spacing1=5)
+
+    def show_disease_buttons(self, data: dict) -> None:
+        """Replace the disease buttons with one for each disease in data"""
+        if self._buttons_job is not None:
+            self.pop_up.after_cancel(self._buttons_job)
+            self._buttons_job = None
+        for button in self.elements["button_container"].winfo_children():
+            button.destroy()
+
+        # Only the first few buttons are needed for the window's first paint; the rest are
+        # added once Tk is idle
+        items = tuple(data.items())
+        max_prob = max(data.values())
+        self.create_disease_buttons(items[:DISEASE_BUTTONS_FIRST], max_prob)
+        if len(items) > DISEASE_BUTTONS_FIRST:
+            self._buttons_job = self.pop_up.after_idle(self.create_disease_buttons,
+                                                       items[DISEASE_BUTTONS_FIRST:], max_prob)
+
+    def show_placeholder_info(self) -> None:
+        """Show the initial helpful message in place of disease information"""
+        self._shown_disease = None
+        self.elements["info_text"].config(state='normal')
+        self.elements["info_text"].delete('1.0', tk.END)
         self.elements["info_text"].insert('1.0',
                                           "👆 Click on a disease button above to view:\n\n"
                                           "  • Detailed medical description\n"
@@ -984,9 +1130,33 @@ class ModernDiagnosisWindow:
                                           "Remember: This is for educational purposes only.")
         self.elements["info_text"].config(state='disabled')
 
+    def create_disease_buttons(self, items: tuple, max_prob: float) -> None:
+        """Add a disease button for each (disease, probability) pair in items"""
+        self._buttons_job = None
+        # Options shared by every disease button, and the thresholds of the adaptive colors
+        # based on relative probability, are worked out once rather than per button
+        button_options = {'fg': 'white', 'font': FONTS['11 bold'], 'bd': 0, 'padx': 15, 'pady': 12,
+                          'cursor': 'hand2', 'activebackground': COLORS.success,
+                          'activeforeground': 'white'}
+        high, medium = max_prob * 0.7, max_prob * 0.4
+        for disease, prob in items:
+            if prob >= high:
+                bg_color = COLORS.accent
+            elif prob >= medium:
+                bg_color = COLORS.warning
+            else:
+                bg_color = COLORS.secondary
+
+            btn = tk.Button(self.elements["button_container"],
+                            text=f"{disease} ({prob:.1f}%)",
+                            bg=bg_color,
+                            command=lambda d=disease: self.show_info(d),
+                            **button_options)
+            btn.pack(fill=tk.X, pady=4)
+
     def create_footer(self) -> None:
         """Create footer with enhanced disclaimer"""
-        footer = tk.Frame(self.pop_up, bg=self.colors['primary'], height=60)
+        footer = tk.Frame(self.pop_up, bg=COLORS.primary, height=60)
         footer.pack(fill=tk.X)
         footer.pack_propagate(False)
 
@@ -994,65 +1164,55 @@ class ModernDiagnosisWindow:
                         text="⚠ CRITICAL DISCLAIMER: These results are probabilistic estimates based on symptom matching. "
                              "This is NOT a medical diagnosis. Always consult qualified healthcare professionals for "
                              "accurate diagnosis and treatment.",
-                        bg=self.colors['primary'],
+                        bg=COLORS.primary,
                         fg='#ECF0F1',
-                        font=('Segoe UI', 10, 'bold'),
+                        font=FONTS['10 bold'],
                         wraplength=1100)
         text.pack(expand=True, pady=10)
 
     def show_info(self, selected: str) -> None:
         """Display disease information with improved formatting"""
-        self.elements["info_text"].config(state='normal')
-        self.elements["info_text"].delete('1.0', tk.END)
+        if selected == self._shown_disease:
+            return  # Clicking the disease already shown changes nothing
+        self._shown_disease = selected
 
-        # Disease name
-        self.elements["info_text"].insert(tk.END, f"{selected}\n", 'title')
-        self.elements["info_text"].insert(tk.END, "═" * 60 + "\n\n", 'separator')
-
-        # Description
-        self.elements["info_text"].insert(tk.END, "📋 MEDICAL DESCRIPTION\n", 'section')
-        self.elements["info_text"].insert(tk.END, f"{DISEASE_DICT[selected].description}\n\n", 'content')
-
-        # Precautions
-        self.elements["info_text"].insert(tk.END, "⚕ RECOMMENDED PRECAUTIONS\n", 'section')
-        for i, precaution in enumerate(DISEASE_DICT[selected].advice, 1):
-            self.elements["info_text"].insert(tk.END, f"  {i}. {precaution}\n", 'content')
-
-        # Disclaimer
-        self.elements["info_text"].insert(tk.END, "\n" + "─" * 60 + "\n", 'separator')
-        self.elements["info_text"].insert(tk.END,
-                                          "⚠ IMPORTANT: This information is for educational purposes only. "
-                                          "These precautions are general recommendations. Always consult "
-                                          "qualified healthcare professionals for personalized medical advice "
-                                          "and treatment plans.\n",
-                                          'disclaimer')
-
-        # Configure tags
-        self.elements["info_text"].tag_config('title',
-                                              font=('Segoe UI', 16, 'bold'),
-                                              foreground=self.colors['primary'])
-        self.elements["info_text"].tag_config('separator',
-                                              foreground=self.colors['border'])
-        self.elements["info_text"].tag_config('section',
-                                              font=('Segoe UI', 12, 'bold'),
-                                              foreground=self.colors['secondary'],
-                                              spacing1=10)
-        self.elements["info_text"].tag_config('content',
-                                              font=('Segoe UI', 11),
-                                              spacing1=5,
-                                              lmargin1=20,
-                                              lmargin2=35)
-        self.elements["info_text"].tag_config('disclaimer',
-                                              font=('Segoe UI', 10, 'bold'),
-                                              foreground=self.colors['accent'],
-                                              spacing1=5)
+        segments = self._disease_text_cache.get(selected)
+        if segments is None:
+            segments = self._disease_text_cache[selected] = self.build_info_segments(selected)
 
+        # One insert call places every segment along with its tag
+        self.elements["info_text"].config(state='normal')
+        self.elements["info_text"].delete('1.0', tk.END)
+        self.elements["info_text"].insert('1.0', *segments)
         self.elements["info_text"].config(state='disabled')
 
+    @staticmethod
+    def build_info_segments(selected: str) -> tuple:
+        """Return the information text of a disease as alternating text and tag name items"""
+        _, _, name_to_disease_map = backend.get_graph()
+        disease = name_to_disease_map[selected]
+        return (
+            # Disease name
+            f"{selected}\n", 'title',
+            "═" * 60 + "\n\n", 'separator',
+            # Description
+            "📋 MEDICAL DESCRIPTION\n", 'section',
+            f"{disease.description}\n\n", 'content',
+            # Precautions
+            "⚕ RECOMMENDED PRECAUTIONS\n", 'section',
+            "".join(f"  {i}. {precaution}\n" for i, precaution in enumerate(disease.advice, 1)), 'content',
+            # Disclaimer
+            "\n" + "─" * 60 + "\n", 'separator',
+            "⚠ IMPORTANT: This information is for educational purposes only. "
+            "These precautions are general recommendations. Always consult "
+            "qualified healthcare professionals for personalized medical advice "
+            "and treatment plans.\n", 'disclaimer'
+        )
+
     def toggle_fullscreen(self, _event: tk.Event = None) -> None:
         """Toggle fullscreen"""
-        is_fullscreen = self.pop_up.attributes('-fullscreen')
-        self.pop_up.attributes('-fullscreen', not is_fullscreen)
+        self._is_fullscreen = not self._is_fullscreen
+        self.pop_up.attributes('-fullscreen', self._is_fullscreen)
 
     def show_help(self, _event: tk.Event = None) -> None:
         """Show help dialog - accessible"""
@@ -1096,16 +1256,118 @@ Press ESC to toggle fullscreen mode."""
         messagebox.showinfo("Help - Diagnosis Results", help_text)
 
 
-# Load data
-DIAGNOSIS_GRAPH, SYMPTOMS_LIST, NAME_TO_DISEASE_MAP = backend.load_diagnosis_graph(
-    'Symptom-severity.csv',
-    'dataset.csv',
-    'symptom_Description.csv',
-    'symptom_precaution.csv')
-SYMPTOM_OPTIONS = sorted(SYMPTOMS_LIST.copy())
-DISEASE_DICT = NAME_TO_DISEASE_MAP
+def init_fonts(root: tk.Tk) -> None:
+    """Create the fonts in FONTS once, so widgets share named fonts instead of each parsing
+    a font description"""
+    if FONTS:
+        return
+    FONTS.update({
+        '9': tkfont.Font(root=root, family='Segoe UI', size=9),
+        '9 italic': tkfont.Font(root=root, family='Segoe UI', size=9, slant='italic'),
+        '10': tkfont.Font(root=root, family='Segoe UI', size=10),
+        '10 bold': tkfont.Font(root=root, family='Segoe UI', size=10, weight='bold'),
+        '11': tkfont.Font(root=root, family='Segoe UI', size=11),
+        '11 bold': tkfont.Font(root=root, family='Segoe UI', size=11, weight='bold'),
+        '11 italic': tkfont.Font(root=root, family='Segoe UI', size=11, slant='italic'),
+        '12': tkfont.Font(root=root, family='Segoe UI', size=12),
+        '12 bold': tkfont.Font(root=root, family='Segoe UI', size=12, weight='bold'),
+        '14': tkfont.Font(root=root, family='Segoe UI', size=14),
+        '14 bold': tkfont.Font(root=root, family='Segoe UI', size=14, weight='bold'),
+        '16 bold': tkfont.Font(root=root, family='Segoe UI', size=16, weight='bold'),
+        '20 bold': tkfont.Font(root=root, family='Segoe UI', size=20, weight='bold'),
+        '24 bold': tkfont.Font(root=root, family='Segoe UI', size=24, weight='bold'),
+        '28 bold': tkfont.Font(root=root, family='Segoe UI', size=28, weight='bold'),
+        '48': tkfont.Font(root=root, family='Segoe UI', size=48),
+    })
+
+
+def build_trigram_index(options: tuple) -> dict:
+    """Map every three-character substring of the strings in options to the sorted indices of
+    the strings containing it"""
+    index = {}
+    for i, option in enumerate(options):
+        for j in range(len(option) - 2):
+            index.setdefault(option[j:j + 3], set()).add(i)
+    return {trigram: sorted(indices) for trigram, indices in index.items()}
+
+
+@lru_cache(maxsize=1)
+def get_chart_executor() -> ThreadPoolExecutor:
+    """Return the executor that renders diagnosis charts off the Tk thread, creating it on
+    first use"""
+    return ThreadPoolExecutor(max_workers=1)
+
+
+@lru_cache(maxsize=1)
+def get_symptom_options() -> tuple[tuple, tuple, dict]:
+    """Return the symptom names in sorted order, their lowercase forms, and the
+    build_trigram_index of the lowercase forms"""
+    _, symptoms_list, _ = backend.get_graph()
+    options = tuple(sorted(symptoms_list))
+    options_lc = tuple(symptom.lower() for symptom in options)
+    return options, options_lc, build_trigram_index(options_lc)
+
+
+def find_symptoms(typed: str) -> list:
+    """Return up to MAX_DROPDOWN_ITEMS symptoms, in sorted order, whose lowercase name
+    contains the lowercase text typed"""
+    options, options_lc, trigrams = get_symptom_options()
+    if len(typed) < 3:
+        candidates = range(len(options))
+    else:
+        # Only symptoms containing every trigram of typed can match, so only those are checked
+        postings = [trigrams.get(typed[j:j + 3]) for j in range(len(typed) - 2)]
+        if None in postings:
+            return []
+        shortest = min(postings, key=len)
+        candidates = sorted(set(shortest).intersection(*postings)) if len(postings) > 1 else shortest
+
+    filtered = []
+    for i in candidates:
+        if typed in options_lc[i]:
+            filtered.append(options[i])
+            if len(filtered) == MAX_DROPDOWN_ITEMS:
+                break
+    return filtered
+
+
+FONTS = {}  # Size and style, e.g. '11 bold' -> Segoe UI font, filled in by init_fonts
+
+# Color Palette - Medical Professional Theme, shared by both windows
+COLORS = SimpleNamespace(
+    primary='#2C3E50',
+    secondary='#3498DB',
+    accent='#E74C3C',
+    success='#27AE60',
+    warning='#F39C12',
+    bg_main='#ECF0F1',
+    bg_card='#FFFFFF',
+    text_dark='#2C3E50',
+    text_light='#7F8C8D',
+    border='#BDC3C7',
+    hover='#3498DB',
+    shadow='#95A5A6'
+)
+
+# Loads data off the Tk thread, so the window can appear before the CSV files are read. It is
+# only started once the app runs, so importing this module does not load anything.
+DATA_LOADER = None
+DATA_POLL_DELAY = 50  # ms between checks on whether DATA_LOADER has finished
+MAX_DROPDOWN_ITEMS = 10
+DIAGNOSIS_CACHE_SIZE = 64  # Number of recent diagnoses ModernDoctorHouseApp remembers
+UPDATE_LIST_DELAY = 60  # ms to wait after the last keystroke before filtering
+CHART_DPI = 100  # Resolution the diagnosis chart is displayed at
+CHART_MIN_SIZE = 100  # Smallest width and height in pixels the chart is rendered at
+CHART_RESIZE_DELAY = 150  # ms to wait after the chart area last changed size before re-rendering
+# The chart is rendered at CHART_DPI / CHART_CROP_FACTOR and scaled up for display. Raising it
+# trades sharpness for less rasterization work, which only pays off for large charts.
+CHART_CROP_FACTOR = 1.0
+CHART_POLL_DELAY = 30  # ms between checks on whether a chart has finished rendering
+DISEASE_BUTTONS_FIRST = 5  # Disease buttons created before the results window is first shown
 
 if __name__ == '__main__':
     root = tk.Tk()
+    DATA_LOADER = threading.Thread(target=get_symptom_options, daemon=True)
+    DATA_LOADER.start()
     app = ModernDoctorHouseApp(root)
     root.mainloop()